@@ -0,0 +1,179 @@
+"""Throughput and allocation benchmark for the PoolPilot payload parsers.
+
+Every parser runs against every payload of ``benchmarks/corpus`` that matches
+its endpoint (``super-*``, ``accueil-*``, ``getreg-*``). Each case reports the
+number of calls per second, the peak memory allocated by a single call and the
+number of memory blocks that call leaves allocated (its result).
+
+Usage (from the repository root, with Home Assistant installed)::
+
+    python benchmarks/bench_parsers.py --save-baseline   # before a change
+    python benchmarks/bench_parsers.py                   # after the change
+
+The second run compares against ``benchmarks/baseline.json`` and exits with
+status 1 when a case lost more than ``--threshold`` percent of throughput.
+Baselines are machine specific and are not committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = Path(__file__).resolve().parent / "corpus"
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ofoehn_poolpilot.coordinator import (  # noqa: E402
+    clean_html_lines,
+    clean_html_text,
+    parse_accueil_html,
+    parse_accueil_values,
+    parse_donnees,
+    parse_reg,
+    parse_super_payload,
+    parse_super_values,
+)
+
+PARSERS: dict[str, tuple[tuple[str, Callable[[str], Any]], ...]] = {
+    "super": (
+        ("parse_super_payload", parse_super_payload),
+        ("parse_super_values", parse_super_values),
+        ("parse_donnees", parse_donnees),
+        ("clean_html_text", clean_html_text),
+        ("clean_html_lines", clean_html_lines),
+    ),
+    "accueil": (
+        ("parse_accueil_html", parse_accueil_html),
+        ("parse_accueil_values", parse_accueil_values),
+        ("parse_donnees", parse_donnees),
+        ("clean_html_text", clean_html_text),
+        ("clean_html_lines", clean_html_lines),
+    ),
+    "getreg": (
+        ("parse_reg", parse_reg),
+        ("clean_html_text", clean_html_text),
+        ("clean_html_lines", clean_html_lines),
+    ),
+}
+DEFAULT_THRESHOLD = 20.0  # percent of throughput lost before failing
+MIN_SECONDS = 0.2  # measuring time per case and repeat
+
+
+def load_corpus() -> dict[str, dict[str, str]]:
+    corpus: dict[str, dict[str, str]] = {endpoint: {} for endpoint in PARSERS}
+    for path in sorted(CORPUS.glob("*.txt")):
+        endpoint = path.name.split("-", 1)[0]
+        if endpoint in corpus:
+            corpus[endpoint][path.stem] = path.read_text(encoding="utf-8")
+    return corpus
+
+
+def measure(parser: Callable[[str], Any], payload: str, repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(lambda: parser(payload))
+    number, elapsed = timer.autorange()
+    while elapsed < MIN_SECONDS:
+        number *= 2
+        elapsed = timer.timeit(number)
+    best = min([elapsed] + timer.repeat(repeat=max(0, repeat - 1), number=number))
+
+    tracemalloc.start()
+    try:
+        parser(payload)
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = parser(payload)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    # Leave out the first snapshot, which is alive when the second is taken.
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    blocks = sum(
+        stat.count_diff
+        for stat in after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    )
+
+    return {
+        "ops_per_s": round(number / best, 1),
+        "peak_kib": round(peak / 1024, 2),
+        "blocks": blocks,
+    }
+
+
+def run(repeat: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for endpoint, payloads in load_corpus().items():
+        for parser_name, parser in PARSERS[endpoint]:
+            for payload_name, payload in payloads.items():
+                results[f"{parser_name}[{payload_name}]"] = measure(parser, payload, repeat)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for case, result in results.items():
+        reference = baseline.get(case)
+        if not reference:
+            continue
+        change = (result["ops_per_s"] / reference["ops_per_s"] - 1) * 100
+        result["change_pct"] = round(change, 1)
+        if change < -threshold:
+            regressions.append(f"{case}: {change:+.1f}% ops/s")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw JSON results")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    regressions: list[str] = []
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        width = max(len(case) for case in results)
+        print(
+            f"{'case':<{width}}  {'ops/s':>12}  {'peak KiB':>9}  {'blocks':>7}  {'vs base':>8}"
+        )
+        for case, result in results.items():
+            change = result.get("change_pct")
+            change_text = f"{change:+.1f}%" if change is not None else "-"
+            print(
+                f"{case:<{width}}  {result['ops_per_s']:>12,.0f}  "
+                f"{result['peak_kib']:>9.2f}  {result.get('blocks', 0):>7}  {change_text:>8}"
+            )
+
+    if regressions:
+        print(f"\nThroughput regressions beyond {args.threshold:.0f}%:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
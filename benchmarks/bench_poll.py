@@ -0,0 +1,168 @@
+"""Poll latency and retry cost of ``OFoehnApi`` against the local simulator.
+
+Starts ``benchmarks/simulator.py`` in-process, then runs ``--polls`` read
+cycles (super.cgi, accueil.cgi, getReg.cgi) the way the coordinator does and
+reports latency percentiles, failed reads and how many HTTP requests the
+simulator actually served per poll (retries and cookie re-logins included).
+
+Usage (from the repository root, with Home Assistant installed)::
+
+    python benchmarks/bench_poll.py --polls 50 --auth cookie --cookie-ttl 2 \\
+        --latency 0.05 --error-rate accueil=0.2 --max-in-flight 3 --retries 1
+
+All fault options of the simulator are accepted; ``--retries`` is passed to
+every read to measure the cost of the retry path. ``--dedicated-session``
+polls through the per-device keep-alive session instead of a shared one and
+``--interval`` waits between polls, e.g. to compare both against the
+simulator's ``--idle-close``::
+
+    python benchmarks/bench_poll.py --polls 10 --interval 2 --idle-close 1 --dedicated-session
+
+``--max-response-size`` (KiB) and ``--response-encoding`` set the limits of
+the body reader; per-page body sizes and decode times are reported::
+
+    python benchmarks/bench_poll.py --polls 10 --encoding iso-8859-1 --no-charset \\
+        --oversize-rate accueil=0.3 --max-response-size 16
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import ClientSession, CookieJar
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from custom_components.ofoehn_poolpilot.coordinator import (  # noqa: E402
+    POLL_ENDPOINTS,
+    OFoehnApi,
+)
+from simulator import PoolPilotSimulator, config_from_args  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _poll(api: OFoehnApi, retries: int) -> tuple[float, dict[str, bool]]:
+    started = time.perf_counter()
+    readers = [getattr(api, reader) for _, _, reader in POLL_ENDPOINTS]
+    if api.max_in_flight > 1:
+        results = await asyncio.gather(*(read(retries=retries) for read in readers), return_exceptions=True)
+    else:
+        results = []
+        for read in readers:
+            try:
+                results.append(await read(retries=retries))
+            except Exception as err:  # noqa: BLE001 - counted as a failed read
+                results.append(err)
+    ok = {key: not isinstance(result, BaseException) for (key, _, _), result in zip(POLL_ENDPOINTS, results)}
+    return time.perf_counter() - started, ok
+
+
+async def run(argv: list[str]) -> int:
+    extra = {
+        "--polls": "20",
+        "--max-in-flight": "1",
+        "--request-timeout": "5",
+        "--retries": "0",
+        "--interval": "0",
+        "--max-response-size": "64",
+        "--response-encoding": "auto",
+    }
+    dedicated = "--dedicated-session" in argv
+    sim_argv: list[str] = []
+    iterator = iter(item for item in argv if item != "--dedicated-session")
+    for item in iterator:
+        name, sep, value = item.partition("=")
+        if name in extra:
+            extra[name] = value if sep else next(iterator)
+        else:
+            sim_argv.append(item)
+    config, args = config_from_args(["--port", "0", *sim_argv])
+    polls = int(extra["--polls"])
+    interval = float(extra["--interval"])
+
+    simulator = PoolPilotSimulator(config)
+    runner = await simulator.start(args.host, 0)
+    port = PoolPilotSimulator.bound_port(runner)
+    try:
+        async with ClientSession(cookie_jar=CookieJar(unsafe=True)) as shared:
+            api = OFoehnApi(
+                host=args.host,
+                port=port,
+                session=None if dedicated else shared,
+                auth_mode=config.auth_mode,
+                username=config.username,
+                password=config.password,
+                timeout=int(extra["--request-timeout"]),
+                max_in_flight=int(extra["--max-in-flight"]),
+            )
+            api.set_body_limits(extra["--max-response-size"], extra["--response-encoding"])
+            await api.prepare_for_reads()
+            latencies: list[float] = []
+            failures = {key: 0 for key, _, _ in POLL_ENDPOINTS}
+            started = time.perf_counter()
+            for index in range(polls):
+                if index and interval:
+                    await asyncio.sleep(interval)
+                elapsed, ok = await _poll(api, int(extra["--retries"]))
+                latencies.append(elapsed)
+                for key, success in ok.items():
+                    failures[key] += not success
+            wall = time.perf_counter() - started
+            await api.async_close()
+    finally:
+        await runner.cleanup()
+
+    served = {name: stats["requests"] for name, stats in simulator.stats.items() if stats["requests"]}
+    print(
+        f"polls: {polls} in {wall:.2f}s ({polls / wall:.1f} polls/s), auth={config.auth_mode}, "
+        f"session={'dedicated' if dedicated else 'shared'}"
+    )
+    print(
+        f"latency: mean {statistics.fmean(latencies) * 1000:.1f} ms, "
+        f"p50 {_percentile(latencies, 50) * 1000:.1f} ms, "
+        f"p95 {_percentile(latencies, 95) * 1000:.1f} ms, "
+        f"max {max(latencies) * 1000:.1f} ms"
+    )
+    print("failed reads: " + ", ".join(f"{key}={count}" for key, count in failures.items()))
+    print(
+        f"requests served: {sum(served.values())} ({sum(served.values()) / polls:.2f} per poll) "
+        + " ".join(f"{name}={count}" for name, count in served.items())
+    )
+    if api.body_stats:
+        print("bodies: " + "; ".join(
+            f"{name} {stats['total_bytes'] / stats['reads']:.0f} B/read, "
+            f"decode {stats['decode_ms'] * 1000:.0f} us (max {stats['max_decode_ms'] * 1000:.0f} us)"
+            for name, stats in api.body_stats.items()
+        ))
+    connections = f"connections opened: {simulator.connections}"
+    if api.connection_stats is not None:
+        connections += " (client " + " ".join(
+            f"{key}={value}" for key, value in api.connection_stats.items()
+        ) + ")"
+    print(connections)
+    injected = {
+        name: {key: value for key, value in stats.items() if key != "requests" and value}
+        for name, stats in simulator.stats.items()
+    }
+    injected = {name: stats for name, stats in injected.items() if stats}
+    if injected:
+        print("injected: " + "; ".join(
+            f"{name} " + " ".join(f"{key}={value}" for key, value in stats.items())
+            for name, stats in injected.items()
+        ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run(sys.argv[1:])))
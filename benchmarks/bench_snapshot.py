@@ -0,0 +1,173 @@
+"""Memory and allocations of the coordinator snapshot.
+
+Compares the typed ``PollSnapshot`` against the flat dict the coordinator
+used to publish (raw payloads, parsed sub-dicts and every flattened field),
+for each set of line payloads of ``benchmarks/corpus``:
+
+* retained memory per entry: what one published snapshot keeps alive, with
+  and without the raw payloads (``enable_raw_sensors``);
+* allocations per poll: blocks and bytes a poll leaves allocated when only
+  super.cgi changed, the other endpoints coming from the parse cache.
+
+Usage (from the repository root, with Home Assistant installed)::
+
+    python benchmarks/bench_snapshot.py --entries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = Path(__file__).resolve().parent / "corpus"
+
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ofoehn_poolpilot.coordinator import (  # noqa: E402
+    parse_accueil_html,
+    parse_donnees,
+    parse_page_metadata,
+    parse_reg,
+    parse_section,
+    parse_super_payload,
+)
+from custom_components.ofoehn_poolpilot.const import DEFAULT_INDEX  # noqa: E402
+from custom_components.ofoehn_poolpilot.snapshot import PollSnapshot  # noqa: E402
+
+CASES = {
+    "lines": ("super-lines-donnee", "accueil-lines", "getreg-lines"),
+    "html": ("super-html-page", "accueil-labelled-page", "getreg-html-page"),
+}
+
+
+def _fresh(text: str) -> str:
+    """A private copy, as a payload read from the network would be."""
+    return text.encode("utf-8").decode("utf-8")
+
+
+def legacy_snapshot(sup: str, acc: str, reg: str, cached: dict[str, Any]) -> dict[str, Any]:
+    """The flat snapshot dict published before PollSnapshot."""
+    parsed_super, super_donnees, metadata = parse_super_payload(sup)
+    if not metadata:
+        metadata = cached.get("metadata") or {}
+    return {
+        "super_raw": sup,
+        "accueil_raw": acc,
+        "reg_raw": reg,
+        "super": super_donnees,
+        "accueil": cached["accueil_donnees"],
+        "reg": cached["reg"],
+        "super_stale": False,
+        "accueil_stale": False,
+        "reg_stale": False,
+        "super_error": None,
+        "accueil_error": None,
+        "reg_error": None,
+        **metadata,
+        **parsed_super,
+        **cached["accueil"],
+        "indices": cached["indices"],
+    }
+
+
+def legacy_cache(acc: str, reg: str) -> dict[str, Any]:
+    return {
+        "accueil": parse_accueil_html(acc),
+        "accueil_donnees": parse_donnees(acc),
+        "reg": parse_reg(reg),
+        "metadata": parse_page_metadata(acc) or parse_page_metadata(reg),
+        "indices": dict(DEFAULT_INDEX),
+    }
+
+
+def typed_cache(acc: str, reg: str, keep_raw: bool) -> dict[str, Any]:
+    return {
+        "accueil": parse_section("accueil", acc, keep_raw=keep_raw),
+        "reg": parse_section("reg", reg, keep_raw=keep_raw),
+        "indices": dict(DEFAULT_INDEX),
+    }
+
+
+def typed_snapshot(sup: str, cached: dict[str, Any], keep_raw: bool) -> PollSnapshot:
+    return PollSnapshot(
+        super=parse_section("super", sup, keep_raw=keep_raw),
+        accueil=cached["accueil"],
+        reg=cached["reg"],
+        indices=cached["indices"],
+    )
+
+
+def retained(build: Callable[[], Any], count: int) -> tuple[float, float]:
+    """Bytes and blocks kept alive per built object."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = [build() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+    return size / count, blocks / count
+
+
+def run(entries: int) -> list[tuple[str, str, float, float, float, float]]:
+    rows = []
+    for case, names in CASES.items():
+        sup, acc, reg = (CORPUS.joinpath(f"{name}.txt").read_text(encoding="utf-8") for name in names)
+
+        def legacy_entry() -> dict[str, Any]:
+            payloads = _fresh(sup), _fresh(acc), _fresh(reg)
+            return legacy_snapshot(*payloads, cached=legacy_cache(*payloads[1:]))
+
+        def typed_entry(keep_raw: bool) -> PollSnapshot:
+            payloads = _fresh(sup), _fresh(acc), _fresh(reg)
+            return typed_snapshot(payloads[0], typed_cache(*payloads[1:], keep_raw), keep_raw)
+
+        legacy_cached = legacy_cache(acc, reg)
+        variants = {
+            "dict (before)": (
+                legacy_entry,
+                lambda: legacy_snapshot(_fresh(sup), acc, reg, legacy_cached),
+            ),
+        }
+        for keep_raw in (False, True):
+            typed_cached = typed_cache(acc, reg, keep_raw)
+            variants[f"PollSnapshot{' + raw' if keep_raw else ''}"] = (
+                lambda keep_raw=keep_raw: typed_entry(keep_raw),
+                lambda keep_raw=keep_raw, cached=typed_cached: typed_snapshot(
+                    _fresh(sup), cached, keep_raw
+                ),
+            )
+        for variant, (entry, poll) in variants.items():
+            entry_bytes, entry_blocks = retained(entry, entries)
+            poll_bytes, poll_blocks = retained(poll, entries)
+            rows.append((case, variant, entry_bytes, entry_blocks, poll_bytes, poll_blocks))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200, help="objects built per measure")
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<6}  {'snapshot':<20}  {'entry KiB':>9}  {'entry blocks':>12}  "
+        f"{'poll KiB':>8}  {'poll blocks':>11}"
+    )
+    for case, variant, entry_bytes, entry_blocks, poll_bytes, poll_blocks in run(args.entries):
+        print(
+            f"{case:<6}  {variant:<20}  {entry_bytes / 1024:>9.2f}  {entry_blocks:>12.0f}  "
+            f"{poll_bytes / 1024:>8.2f}  {poll_blocks:>11.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""Local PoolPilot device simulator with latency and fault injection.
+
+Serves the CGI endpoints used by the integration (accueil.cgi, super.cgi,
+getReg.cgi, setReg.cgi, changeOnOff.cgi, toggleE.cgi, login.cgi) with payloads
+in the device's line layout. Writes change the simulated pump state, so a
+setpoint, mode, power or light command shows up in the next reads.
+
+Every endpoint can be slowed down or made to fail::
+
+    python benchmarks/simulator.py --port 8080 --auth cookie \\
+        --latency super=0.3 --jitter 0.1 --timeout-rate accueil=0.2 \\
+        --error-rate getReg=0.1 --truncate-rate super=0.05 --cookie-ttl 60
+
+``--oversize-rate`` streams a multi-megabyte body, as a captive portal might,
+and ``--encoding``/``--no-charset`` change how the pages are encoded and
+announced.
+
+Endpoint names are the CGI names without ``.cgi``; ``*`` applies to all of
+them. Only aiohttp is needed to run the simulator.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+AUTH_MODES = ("none", "basic", "query", "cookie")
+ENDPOINT_NAMES = (
+    "accueil",
+    "super",
+    "getReg",
+    "setReg",
+    "changeOnOff",
+    "toggleE",
+    "login",
+)
+COOKIE_NAME = "PPSESSION"
+HANG_SECONDS = 120  # how long a simulated timeout keeps the request open
+OVERSIZE_BYTES = 4 * 1024 * 1024  # body streamed by an oversized response
+OVERSIZE_CHUNK = 16 * 1024
+
+
+@dataclass
+class EndpointFaults:
+    """Latency and failure injection for one endpoint."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    timeout_rate: float = 0.0
+    error_rate: float = 0.0
+    truncate_rate: float = 0.0
+    oversize_rate: float = 0.0
+
+
+@dataclass
+class SimulatorConfig:
+    auth_mode: str = "none"
+    username: str = "admin"
+    password: str = "admin"
+    user_field: str = "user"
+    pass_field: str = "pass"
+    cookie_ttl: float | None = None  # seconds before a session cookie expires
+    idle_close: float = 75.0  # seconds before an idle keep-alive connection is closed
+    encoding: str = "utf-8"
+    announce_charset: bool = True  # False omits the charset from Content-Type
+    seed: int | None = None
+    faults: dict[str, EndpointFaults] = field(default_factory=dict)
+
+    def faults_for(self, endpoint: str) -> EndpointFaults:
+        return self.faults.get(endpoint) or self.faults.get("*") or EndpointFaults()
+
+
+@dataclass
+class PumpState:
+    mode: str = "CHAUD"
+    setpoint: float = 28.0
+    water_in: float = 26.4
+    water_out: float = 27.1
+    air_temp: float = 18.5
+    power_on: bool = True
+    light_on: bool = False
+    compressor_on: bool = True
+    pump_on: bool = True
+
+    def tick(self, rng: random.Random) -> None:
+        """Drift the water temperature towards the setpoint."""
+        if self.power_on and self.compressor_on:
+            step = 0.05 if self.water_in < self.setpoint else -0.05
+            self.water_in = round(self.water_in + step + rng.uniform(-0.02, 0.02), 1)
+        self.water_out = round(self.water_in + (0.7 if self.compressor_on else 0.0), 1)
+        self.compressor_on = self.power_on and abs(self.setpoint - self.water_in) > 0.3
+
+
+def _on_off(value: bool) -> str:
+    return "ON" if value else "OFF"
+
+
+def render_super(state: PumpState) -> str:
+    lines = [
+        "OK", "OK", "OK", "OK", "OFF",
+        f"{state.water_in:.1f}", f"{state.water_out:.1f}", f"{state.air_temp:.1f}",
+        "45.2", "12.0", "0.0", "0.0", "12.5", "23.1",
+        "OFF", "OFF", _on_off(state.pump_on), _on_off(state.compressor_on), "OFF",
+        _on_off(state.compressor_on), "OFF", "OFF", "1", _on_off(state.power_on), "1",
+        "25.0", "4.5", "120", "55.3", f"{state.setpoint - state.water_in:.1f}", "Non",
+    ]
+    donnees = {
+        5: state.water_in,
+        6: state.water_out,
+        7: state.air_temp,
+        8: 230,
+        9: 35.2,
+        10: int(state.pump_on),
+        11: int(state.compressor_on),
+        16: int(state.light_on),
+        24: int(state.power_on),
+    }
+    lines.extend(f"DONNEE{index}={value}" for index, value in donnees.items())
+    return "\r\n".join(lines) + "\r\n"
+
+
+def render_accueil(state: PumpState) -> str:
+    now = time.localtime()
+    lines = [
+        state.mode.capitalize() if state.power_on else "OFF",
+        f"{state.water_in:.1f}&deg;C ({state.setpoint:.1f}&deg;C)",
+        "Régulation temp. eau", "Non (Automne)", _on_off(state.compressor_on),
+        _on_off(state.pump_on), "Marche" if state.power_on else "Arrêtée", "Aucune", "Normal",
+        f"{state.setpoint - state.water_in:.1f}°C", f"{state.air_temp:.1f}°C", "12.5", "23.1",
+        "2103150042", "PoolPilot-WiFi", "0", "TIMER(s) : Inactifs",
+        time.strftime("%d/%m/%Y", now), time.strftime("%H:%M:%S", now),
+        "AA:BB:CC:DD:EE:FF", "B123", "3.14", "En option", "En option", "-61",
+        "231.5V", "35.2°C", "CFG01", "HW22", "Non",
+    ]
+    return "<br>\n".join(lines) + f"\nDONNEE16={int(state.light_on)} DONNEE24={int(state.power_on)}\n"
+
+
+def render_reg(state: PumpState) -> str:
+    lines = [
+        state.mode,
+        f"{state.setpoint - 1:.1f}", f"{state.setpoint:.1f}", f"{state.setpoint - 2:.1f}",
+        "1.0", "Eau", "0", "1", "0", "1", "0", "0",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class PoolPilotSimulator:
+    """aiohttp application emulating one PoolPilot web server."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self.state = PumpState()
+        self.rng = random.Random(self.config.seed)
+        self.sessions: dict[str, float] = {}
+        self.stats: dict[str, dict[str, int]] = {
+            name: {
+                "requests": 0,
+                "timeouts": 0,
+                "errors": 0,
+                "truncated": 0,
+                "oversized": 0,
+                "unauthorized": 0,
+            }
+            for name in ENDPOINT_NAMES
+        }
+        self.connections = 0  # distinct client connections accepted
+        self._peers: set[tuple] = set()
+        self.app = web.Application()
+        self.app.router.add_route("*", "/accueil.cgi", self._handler("accueil", self._accueil))
+        self.app.router.add_route("*", "/super.cgi", self._handler("super", self._super))
+        self.app.router.add_route("*", "/getReg.cgi", self._handler("getReg", self._get_reg))
+        self.app.router.add_route("*", "/setReg.cgi", self._handler("setReg", self._set_reg))
+        self.app.router.add_route("*", "/changeOnOff.cgi", self._handler("changeOnOff", self._toggle))
+        self.app.router.add_route("*", "/toggleE.cgi", self._handler("toggleE", self._light))
+        self.app.router.add_route("*", "/login.cgi", self._handler("login", self._login, auth=False))
+
+    def _handler(self, endpoint: str, render, *, auth: bool = True):
+        async def handle(request: web.Request) -> web.StreamResponse:
+            stats = self.stats[endpoint]
+            stats["requests"] += 1
+            peer = request.transport.get_extra_info("peername") if request.transport else None
+            if peer is not None and peer not in self._peers:
+                self._peers.add(peer)
+                self.connections += 1
+            faults = self.config.faults_for(endpoint)
+            delay = faults.latency + (self.rng.uniform(0, faults.jitter) if faults.jitter else 0.0)
+            if delay:
+                await asyncio.sleep(delay)
+            if self.rng.random() < faults.timeout_rate:
+                stats["timeouts"] += 1
+                await asyncio.sleep(HANG_SECONDS)
+            if self.rng.random() < faults.error_rate:
+                stats["errors"] += 1
+                raise web.HTTPServiceUnavailable(text="busy")
+            if auth and not await self._authorized(request):
+                stats["unauthorized"] += 1
+                raise web.HTTPUnauthorized(text="login required")
+            body = await render(request)
+            if isinstance(body, web.StreamResponse):
+                return body
+            if self.rng.random() < faults.oversize_rate:
+                stats["oversized"] += 1
+                return await self._oversized(request)
+            if self.rng.random() < faults.truncate_rate:
+                stats["truncated"] += 1
+                return await self._truncated(request, body)
+            return web.Response(body=body.encode(self.config.encoding), headers=self._headers())
+
+        return handle
+
+    def _headers(self) -> dict[str, str]:
+        if self.config.announce_charset:
+            return {"Content-Type": f"text/html; charset={self.config.encoding}"}
+        return {"Content-Type": "text/html"}
+
+    async def _oversized(self, request: web.Request) -> web.StreamResponse:
+        """Stream a chunked body far larger than any CGI page."""
+        response = web.StreamResponse(headers=self._headers())
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        chunk = b"<p>" + b"x" * (OVERSIZE_CHUNK - 7) + b"</p>\n"
+        try:
+            for _ in range(OVERSIZE_BYTES // OVERSIZE_CHUNK):
+                await response.write(chunk)
+            await response.write_eof()
+        except ConnectionError:
+            pass  # the client gave up on the body, which is the point
+        return response
+
+    async def _truncated(self, request: web.Request, body: str) -> web.StreamResponse:
+        """Announce the full body but close the connection halfway through."""
+        data = body.encode(self.config.encoding)
+        response = web.StreamResponse(headers=self._headers())
+        response.content_length = len(data)
+        await response.prepare(request)
+        await response.write(data[: len(data) // 2])
+        if request.transport is not None:
+            request.transport.close()
+        return response
+
+    async def _authorized(self, request: web.Request) -> bool:
+        mode = self.config.auth_mode
+        if mode == "none":
+            return True
+        if mode == "basic":
+            header = request.headers.get("Authorization", "")
+            expected = base64.b64encode(
+                f"{self.config.username}:{self.config.password}".encode()
+            ).decode()
+            return header == f"Basic {expected}"
+        if mode == "query":
+            params: dict[str, Any] = dict(request.query)
+            if request.method == "POST" and request.content_type == "application/x-www-form-urlencoded":
+                params.update(await request.post())
+            return (
+                params.get(self.config.user_field) == self.config.username
+                and params.get(self.config.pass_field) == self.config.password
+            )
+        token = request.cookies.get(COOKIE_NAME)
+        expires = self.sessions.get(token or "")
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            self.sessions.pop(token, None)
+            return False
+        return True
+
+    async def _login(self, request: web.Request) -> web.Response:
+        params: dict[str, Any] = dict(request.query)
+        if request.method == "POST":
+            params.update(await request.post())
+        if (
+            params.get(self.config.user_field) != self.config.username
+            or params.get(self.config.pass_field) != self.config.password
+        ):
+            raise web.HTTPUnauthorized(text="bad credentials")
+        token = secrets.token_hex(8)
+        ttl = self.config.cookie_ttl
+        self.sessions[token] = time.monotonic() + (ttl if ttl is not None else float("inf"))
+        response = web.Response(text="OK")
+        response.set_cookie(COOKIE_NAME, token)
+        return response
+
+    async def _super(self, request: web.Request) -> str:
+        self.state.tick(self.rng)
+        return render_super(self.state)
+
+    async def _accueil(self, request: web.Request) -> str:
+        return render_accueil(self.state)
+
+    async def _get_reg(self, request: web.Request) -> str:
+        return render_reg(self.state)
+
+    async def _set_reg(self, request: web.Request) -> str:
+        form = await request.post()
+        mode = str(form.get("mode", "")).upper()
+        if mode in {"CHAUD", "FROID", "AUTO"}:
+            self.state.mode = mode
+        for key in ("consigneChaud", "consigneFroid", "consigneAuto"):
+            if key in form:
+                try:
+                    self.state.setpoint = float(str(form[key]).replace(",", "."))
+                except ValueError:
+                    raise web.HTTPBadRequest(text=f"invalid {key}") from None
+        return "OK"
+
+    async def _toggle(self, request: web.Request) -> str:
+        self.state.power_on = not self.state.power_on
+        return "OK"
+
+    async def _light(self, request: web.Request) -> str:
+        body = (await request.text()).strip()
+        if body in {"0", "1"}:
+            self.state.light_on = body == "1"
+        else:
+            self.state.light_on = not self.state.light_on
+        return "OK"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> web.AppRunner:
+        """Start serving; returns the runner (see ``bound_port``)."""
+        runner = web.AppRunner(
+            self.app, handle_signals=False, keepalive_timeout=self.config.idle_close
+        )
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        return runner
+
+    @staticmethod
+    def bound_port(runner: web.AppRunner) -> int:
+        for address in runner.addresses:
+            return address[1]
+        raise RuntimeError("simulator is not running")
+
+
+def _parse_rates(values: list[str], attribute: str, faults: dict[str, EndpointFaults]) -> None:
+    for item in values:
+        name, _, raw = item.partition("=")
+        if not raw:
+            name, raw = "*", name
+        if name != "*" and name not in ENDPOINT_NAMES:
+            raise SystemExit(f"unknown endpoint {name!r}, expected one of {', '.join(ENDPOINT_NAMES)}")
+        setattr(faults.setdefault(name, EndpointFaults()), attribute, float(raw))
+
+
+def config_from_args(argv: list[str] | None = None) -> tuple[SimulatorConfig, argparse.Namespace]:
+    parser = argparse.ArgumentParser(description="PoolPilot device simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--auth", choices=AUTH_MODES, default="none")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--cookie-ttl", type=float, default=None)
+    parser.add_argument(
+        "--idle-close", type=float, default=75.0, help="close idle keep-alive connections after N seconds"
+    )
+    parser.add_argument("--encoding", choices=("utf-8", "iso-8859-1"), default="utf-8")
+    parser.add_argument(
+        "--no-charset", action="store_true", help="omit the charset from the Content-Type header"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    for option, help_text in (
+        ("latency", "added latency in seconds"),
+        ("jitter", "random extra latency up to this many seconds"),
+        ("timeout-rate", "probability the request hangs"),
+        ("error-rate", "probability of an HTTP 503"),
+        ("truncate-rate", "probability the body is cut halfway"),
+        ("oversize-rate", "probability of a multi-megabyte body"),
+    ):
+        parser.add_argument(
+            f"--{option}",
+            action="append",
+            default=[],
+            metavar="[ENDPOINT=]VALUE",
+            help=help_text,
+        )
+    args = parser.parse_args(argv)
+
+    faults: dict[str, EndpointFaults] = {}
+    _parse_rates(args.latency, "latency", faults)
+    _parse_rates(args.jitter, "jitter", faults)
+    _parse_rates(args.timeout_rate, "timeout_rate", faults)
+    _parse_rates(args.error_rate, "error_rate", faults)
+    _parse_rates(args.truncate_rate, "truncate_rate", faults)
+    _parse_rates(args.oversize_rate, "oversize_rate", faults)
+    config = SimulatorConfig(
+        auth_mode=args.auth,
+        username=args.username,
+        password=args.password,
+        cookie_ttl=args.cookie_ttl,
+        idle_close=args.idle_close,
+        encoding=args.encoding,
+        announce_charset=not args.no_charset,
+        seed=args.seed,
+        faults=faults,
+    )
+    return config, args
+
+
+async def _serve(config: SimulatorConfig, host: str, port: int) -> None:
+    simulator = PoolPilotSimulator(config)
+    runner = await simulator.start(host, port)
+    print(f"PoolPilot simulator listening on http://{host}:{PoolPilotSimulator.bound_port(runner)} "
+          f"(auth={config.auth_mode})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    config, args = config_from_args()
+    try:
+        asyncio.run(_serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,62 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from pathlib import Path
+from typing import Any
 
+import voluptuous as vol
 from aiohttp import ClientSession
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
+    CONF_DEDICATED_SESSION,
     CONF_ENABLE_RAW_SENSORS,
     CONF_SCAN_INTERVAL,
+    DATA_SCHEDULER,
+    DEFAULT_PROFILE_CYCLES,
     DOMAIN,
+    MAX_IN_FLIGHT_LIMIT,
+    MAX_PROFILE_CYCLES,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     PLATFORMS,
     SCAN_INTERVAL,
+    SNAPSHOT_STORAGE_VERSION,
     DEFAULT_TIMEOUT,
 )
 from .coordinator import OFoehnApi, OFoehnCoordinator
 from .helpers import build_device_info
+from .scheduler import async_get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+PROBE_CONCURRENCY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("max_level", default=MAX_IN_FLIGHT_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_IN_FLIGHT_LIMIT)
+        ),
+    }
+)
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("cycles", default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional("cprofile", default=False): cv.boolean,
+    }
+)
+SERVICES = ("check_connection", "probe_concurrency", "profile")
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot")
 
 
 def _scan_interval_from_options(options: dict) -> timedelta:
@@ -43,7 +75,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    session: ClientSession = async_get_clientsession(hass)
+    session: ClientSession | None = None
+    if not entry.options.get(CONF_DEDICATED_SESSION, False):
+        session = async_get_clientsession(hass)
+    scheduler = async_get_scheduler(hass)
 
     api = OFoehnApi(
         host=entry.data["host"],
@@ -58,6 +93,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         pass_field=entry.data.get("pass_field", "pass"),
         timeout=entry.data.get("timeout", DEFAULT_TIMEOUT),
     )
+    entry.async_on_unload(api.async_close)
 
     coordinator = OFoehnCoordinator(
         hass=hass,
@@ -66,15 +102,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         api=api,
         update_interval=_scan_interval_from_options(entry.options),
         options=entry.options,
+        poll_slots=scheduler.slots,
+        store=_snapshot_store(hass, entry),
     )
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady as err:
-        _LOGGER.warning(
-            "Initial poll failed for %s — integration stays configurable: %s",
-            entry.data["host"],
-            err,
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the last known state; do not hold up startup
+        # for a pump that may not answer.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} first poll {entry.data['host']}",
         )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady as err:
+            _LOGGER.warning(
+                "Initial poll failed for %s — integration stays configurable: %s",
+                entry.data["host"],
+                err,
+            )
 
     entry_updates = dict(entry.data)
     changed = False
@@ -97,6 +144,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "device_key": device_key,
         "device_info": device_info,
     }
+    scheduler.async_reschedule()
 
     async def _async_check_connection_service(call: ServiceCall) -> dict[str, bool]:
         results: dict[str, bool] = {}
@@ -110,10 +158,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.info("Connectivity check for %s: %s", info["host"], res)
         return results
 
+    async def _async_probe_concurrency_service(call: ServiceCall) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        for info in hass.data.get(DOMAIN, {}).values():
+            res = await info["api"].probe_concurrency(call.data["max_level"])
+            results[info["host"]] = res
+            _LOGGER.info(
+                "Concurrency probe for %s: recommended max_in_flight=%s",
+                info["host"],
+                res["recommended"],
+            )
+        return results
+
+    async def _async_profile_service(call: ServiceCall) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        stamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        for info in hass.data.get(DOMAIN, {}).values():
+            profile = await info["coordinator"].async_profile(
+                call.data["cycles"], call.data["cprofile"]
+            )
+            path = Path(hass.config.path(f"{DOMAIN}_profile_{slugify(info['host'])}_{stamp}.json"))
+            files = await hass.async_add_executor_job(profile.write, path)
+            results[info["host"]] = {**profile.summary(), "files": files}
+            _LOGGER.info("Poll profile for %s written to %s", info["host"], files[0])
+        return results
+
     if not hass.services.has_service(DOMAIN, "check_connection"):
         hass.services.async_register(
             DOMAIN, "check_connection", _async_check_connection_service, supports_response=True
         )
+    if not hass.services.has_service(DOMAIN, "probe_concurrency"):
+        hass.services.async_register(
+            DOMAIN,
+            "probe_concurrency",
+            _async_probe_concurrency_service,
+            schema=PROBE_CONCURRENCY_SCHEMA,
+            supports_response=True,
+        )
+    if not hass.services.has_service(DOMAIN, "profile"):
+        hass.services.async_register(
+            DOMAIN,
+            "profile",
+            _async_profile_service,
+            schema=PROFILE_SCHEMA,
+            supports_response=True,
+        )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -125,11 +214,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
-        if not hass.data[DOMAIN] and hass.services.has_service(DOMAIN, "check_connection"):
-            hass.services.async_remove(DOMAIN, "check_connection")
+        if hass.data[DOMAIN]:
+            # Spread the remaining entries over the freed phase.
+            hass.data[DATA_SCHEDULER].async_reschedule()
+        else:
+            hass.data.pop(DATA_SCHEDULER).async_stop()
+            for service in SERVICES:
+                if hass.services.has_service(DOMAIN, service):
+                    hass.services.async_remove(DOMAIN, service)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _snapshot_store(hass, entry).async_remove()
+
+
 async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if data is None:
@@ -139,12 +238,14 @@ async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None
     new_options = dict(entry.options)
     coordinator: OFoehnCoordinator = data["coordinator"]
 
-    reload_needed = previous_options.get(CONF_ENABLE_RAW_SENSORS) != new_options.get(
-        CONF_ENABLE_RAW_SENSORS
+    reload_needed = any(
+        previous_options.get(key) != new_options.get(key)
+        for key in (CONF_ENABLE_RAW_SENSORS, CONF_DEDICATED_SESSION)
     )
 
     coordinator.set_options(new_options)
-    coordinator.update_interval = _scan_interval_from_options(new_options)
+    coordinator.set_poll_interval(_scan_interval_from_options(new_options))
+    hass.data[DATA_SCHEDULER].async_reschedule()
 
     if reload_needed:
         await hass.config_entries.async_reload(entry.entry_id)
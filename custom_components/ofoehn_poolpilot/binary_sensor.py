@@ -4,7 +4,7 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 
 from .const import DOMAIN
 from .coordinator import OFoehnCoordinator
-from .helpers import OFoehnEntity, get_donnee_bool
+from .helpers import OFoehnEntity
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -61,13 +61,7 @@ class PumpBinarySensor(OFoehnEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        result = get_donnee_bool(
-            self.coordinator.data,
-            "pump_idx",
-            fallback_key="pump_on",
-            default=False,
-        )
-        return bool(result)
+        return self.coordinator.view.pump_on
 
 
 class HeatingBinarySensor(OFoehnEntity, BinarySensorEntity):
@@ -84,13 +78,4 @@ class HeatingBinarySensor(OFoehnEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        result = get_donnee_bool(
-            self.coordinator.data,
-            "heating_idx",
-            fallback_key=None,
-            default=None,
-        )
-        if result is not None:
-            return result
-        data = self.coordinator.data
-        return bool(data.get("compressor_1_on") or data.get("compressor_2_on"))
+        return self.coordinator.view.heating_on
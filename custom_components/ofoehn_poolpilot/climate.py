@@ -6,9 +6,15 @@ from homeassistant.const import UnitOfTemperature
 
 from .const import DOMAIN
 from .coordinator import OFoehnCoordinator
-from .helpers import OFoehnEntity, get_donnee_bool, get_donnee_float
+from .helpers import OFoehnEntity
 
 SUPPORTED_HVAC = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO]
+HVAC_BY_MODE = {
+    "OFF": HVACMode.OFF,
+    "CHAUD": HVACMode.HEAT,
+    "FROID": HVACMode.COOL,
+    "AUTO": HVACMode.AUTO,
+}
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -38,64 +44,33 @@ class OFoehnClimate(OFoehnEntity, ClimateEntity):
         self._attr_unique_id = f"ofoehn_climate_{device_key}"
 
     def _is_power_on(self) -> bool:
-        result = get_donnee_bool(
-            self.coordinator.data,
-            "power_idx",
-            fallback_key="power_on",
-            default=True,
-        )
-        return bool(result)
+        return self.coordinator.view.power_on
 
     async def _power_on(self):
         if not self._is_power_on():
-            await self.coordinator.api.toggle_power()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.toggle_power(), ("super",), power=True)
 
     async def _power_off(self):
         if self._is_power_on():
-            await self.coordinator.api.toggle_power()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.toggle_power(), ("super",), power=False)
 
     @property
     def current_temperature(self):
-        return get_donnee_float(
-            self.coordinator.data,
-            "water_in_idx",
-            fallback_key="water_in",
-        )
+        return self.coordinator.view.water_in
 
     @property
     def target_temperature(self):
-        value = self.coordinator.data["reg"].get("setpoint")
-        if value is not None:
-            return value
-        return self.coordinator.data.get("setpoint")
+        return self.coordinator.view.target_temperature
 
     @property
     def hvac_mode(self):
-        if not self._is_power_on():
-            return HVACMode.OFF
-        reg_mode = self.coordinator.data["reg"].get("mode")
-        accueil_mode = self.coordinator.data.get("mode")
-        reg_raw = (self.coordinator.data.get("reg_raw") or "").upper()
-        mode = reg_mode
-        if accueil_mode and (mode is None or (mode == "AUTO" and "AUTO" not in reg_raw)):
-            mode = accueil_mode
-        if mode is None:
-            mode = "AUTO"
-        if mode == "CHAUD":
-            return HVACMode.HEAT
-        if mode == "FROID":
-            return HVACMode.COOL
-        if mode == "OFF":
-            return HVACMode.OFF
-        return HVACMode.AUTO
+        return HVAC_BY_MODE[self.coordinator.view.climate_mode]
 
     async def async_set_temperature(self, **kwargs):
         temp = kwargs.get("temperature")
         if temp is not None:
-            await self.coordinator.api.set_setpoint(float(temp))
-            await self.coordinator.async_request_refresh()
+            temp = float(temp)
+            await self.coordinator.async_write(self.coordinator.api.set_setpoint(temp), ("reg",), setpoint=temp)
 
     async def async_set_hvac_mode(self, hvac_mode):
         if hvac_mode == HVACMode.OFF:
@@ -107,5 +82,5 @@ class OFoehnClimate(OFoehnEntity, ClimateEntity):
             HVACMode.COOL: "FROID",
             HVACMode.AUTO: "AUTO",
         }
-        await self.coordinator.api.set_mode(mapping.get(hvac_mode, "AUTO"))
-        await self.coordinator.async_request_refresh()
+        mode = mapping.get(hvac_mode, "AUTO")
+        await self.coordinator.async_write(self.coordinator.api.set_mode(mode), ("reg",), mode=mode)
@@ -12,11 +12,22 @@ from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .coordinator import OFoehnApi, parse_accueil_html, parse_donnees
+from .coordinator import OFoehnApi, OFoehnCoordinator, parse_accueil_html, parse_donnees
 
 from .const import (
+    CONF_ACCUEIL_REFRESH_TICKS,
+    CONF_ACCUEIL_TIMEOUT,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_DEDICATED_SESSION,
     CONF_ENABLE_RAW_SENSORS,
+    CONF_MAX_IN_FLIGHT,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_POLL_DEADLINE,
+    CONF_RESPONSE_ENCODING,
+    CONF_REG_REFRESH_TICKS,
+    CONF_REG_TIMEOUT,
     CONF_SCAN_INTERVAL,
+    CONF_SUPER_TIMEOUT,
     CONFIG_FLOW_TIMEOUT,
     CONFIG_FLOW_VALIDATION_MAX,
     DOMAIN,
@@ -26,13 +37,29 @@ from .const import (
     AUTH_BASIC,
     AUTH_QUERY,
     AUTH_COOKIE,
+    DEFAULT_ACCUEIL_REFRESH_TICKS,
     DEFAULT_INDEX,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_RESPONSE_SIZE,
+    DEFAULT_POLL_DEADLINE,
+    DEFAULT_REG_REFRESH_TICKS,
+    MAX_ENDPOINT_TIMEOUT,
+    MAX_IN_FLIGHT_LIMIT,
+    MAX_MAX_RESPONSE_SIZE,
+    MAX_POLL_DEADLINE,
+    MAX_REFRESH_TICKS,
     MAX_SCAN_INTERVAL,
+    MIN_MAX_RESPONSE_SIZE,
+    MIN_POLL_DEADLINE,
     MIN_SCAN_INTERVAL,
+    RESPONSE_ENCODING_AUTO,
+    RESPONSE_ENCODINGS,
     SCAN_INTERVAL,
 )
 
 AUTH_OPTIONS = [AUTH_NONE, AUTH_BASIC, AUTH_QUERY, AUTH_COOKIE]
+# Pages read at once to validate the connection.
+PROBE_ENDPOINTS = (("super.cgi", "read_super"), ("accueil.cgi", "read_accueil"))
 
 
 class CannotConnect(HomeAssistantError):
@@ -58,15 +85,67 @@ class ConnectionTimeout(HomeAssistantError):
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    def __init__(self) -> None:
+        # Per-page outcome of the last connection probe, shown with the errors.
+        self._probe_results: dict[str, str] = {}
+
     @staticmethod
     def _validation_timeout(user_timeout: int) -> int:
         return min(max(int(user_timeout), 3), CONFIG_FLOW_TIMEOUT)
 
     async def _async_probe_device(self, api: OFoehnApi) -> tuple[str, str]:
+        """Read super.cgi and accueil.cgi at once; the first failure cancels the other.
+
+        The outcome and duration of each read land in ``_probe_results``.
+        """
+        self._probe_results = {name: "no answer" for name, _ in PROBE_ENDPOINTS}
         await api.prepare_for_reads()
-        raw_super = await api.read_super(retries=0)
-        raw_accueil = await api.read_accueil(retries=0)
-        return raw_super, raw_accueil
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def _read(name: str, reader: str) -> str:
+            try:
+                raw = await getattr(api, reader)(retries=0)
+            except Exception as err:
+                reason = (
+                    f"HTTP {err.status}"
+                    if isinstance(err, ClientResponseError)
+                    else type(err).__name__
+                )
+                self._probe_results[name] = f"{reason} after {loop.time() - started:.2f} s"
+                raise
+            self._probe_results[name] = f"{loop.time() - started:.2f} s"
+            return raw
+
+        tasks = {
+            name: asyncio.create_task(_read(name, reader)) for name, reader in PROBE_ENDPOINTS
+        }
+        try:
+            await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Stop what is left after a failure, or when the overall deadline
+            # cancels the probe (those pages stay "no answer"), and collect
+            # every outcome so no task exception goes unretrieved.
+            for task in tasks.values():
+                task.cancel()
+            results = dict(
+                zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True))
+            )
+        errors = [result for result in results.values() if isinstance(result, Exception)]
+        if errors:
+            for name, result in results.items():
+                if isinstance(result, asyncio.CancelledError):
+                    self._probe_results[name] = "cancelled"
+            # super.cgi first: it tells the most about the device.
+            raise errors[0]
+        return results["super.cgi"], results["accueil.cgi"]
+
+    def _probe_placeholder(self) -> str:
+        if not self._probe_results:
+            return ""
+        return "(" + ", ".join(
+            f"{name}: {result}" for name, result in self._probe_results.items()
+        ) + ")"
 
     def _normalize_host(self, value: str) -> tuple[str, int | None]:
         raw = value.strip()
@@ -133,6 +212,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             user_field=data.get("user_field", "user"),
             pass_field=data.get("pass_field", "pass"),
             timeout=probe_timeout,
+            max_in_flight=len(PROBE_ENDPOINTS),
         )
 
         try:
@@ -249,6 +329,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id=step_id,
             data_schema=self._build_user_schema(defaults),
             errors=errors,
+            description_placeholders={"probe": self._probe_placeholder() if errors else ""},
         )
 
     @staticmethod
@@ -257,162 +338,146 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return OptionsFlowHandler()
 
 
+def _options_schema(
+    options: dict[str, Any], entry_timeout: int, donnees: dict[int, float]
+) -> vol.Schema:
+    """Options form; the DONNEE index fields become selects when values are known."""
+    index_description = None
+    if donnees:
+        index_description = {
+            "selector": {
+                "select": {
+                    "options": [
+                        {"value": i, "label": f"{i} ({v})"}
+                        for i, v in sorted(donnees.items())
+                    ]
+                }
+            }
+        }
+    fields = {
+        vol.Optional(
+            CONF_SCAN_INTERVAL,
+            default=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
+        ): vol.All(int, vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+        vol.Optional(
+            CONF_ADAPTIVE_INTERVAL,
+            default=options.get(CONF_ADAPTIVE_INTERVAL, False),
+        ): bool,
+        vol.Optional(
+            CONF_ENABLE_RAW_SENSORS,
+            default=options.get(CONF_ENABLE_RAW_SENSORS, False),
+        ): bool,
+        vol.Optional(
+            CONF_DEDICATED_SESSION,
+            default=options.get(CONF_DEDICATED_SESSION, False),
+        ): bool,
+        vol.Optional(
+            CONF_MAX_IN_FLIGHT,
+            default=options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+        ): vol.All(int, vol.Range(min=1, max=MAX_IN_FLIGHT_LIMIT)),
+        vol.Optional(
+            CONF_ACCUEIL_REFRESH_TICKS,
+            default=options.get(CONF_ACCUEIL_REFRESH_TICKS, DEFAULT_ACCUEIL_REFRESH_TICKS),
+        ): vol.All(int, vol.Range(min=1, max=MAX_REFRESH_TICKS)),
+        vol.Optional(
+            CONF_REG_REFRESH_TICKS,
+            default=options.get(CONF_REG_REFRESH_TICKS, DEFAULT_REG_REFRESH_TICKS),
+        ): vol.All(int, vol.Range(min=1, max=MAX_REFRESH_TICKS)),
+        vol.Optional(
+            CONF_SUPER_TIMEOUT,
+            default=options.get(CONF_SUPER_TIMEOUT, entry_timeout),
+        ): vol.All(int, vol.Range(min=1, max=MAX_ENDPOINT_TIMEOUT)),
+        vol.Optional(
+            CONF_ACCUEIL_TIMEOUT,
+            default=options.get(CONF_ACCUEIL_TIMEOUT, entry_timeout),
+        ): vol.All(int, vol.Range(min=1, max=MAX_ENDPOINT_TIMEOUT)),
+        vol.Optional(
+            CONF_REG_TIMEOUT,
+            default=options.get(CONF_REG_TIMEOUT, entry_timeout),
+        ): vol.All(int, vol.Range(min=1, max=MAX_ENDPOINT_TIMEOUT)),
+        vol.Optional(
+            CONF_POLL_DEADLINE,
+            default=options.get(CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE),
+        ): vol.All(int, vol.Range(min=MIN_POLL_DEADLINE, max=MAX_POLL_DEADLINE)),
+        vol.Optional(
+            CONF_MAX_RESPONSE_SIZE,
+            default=options.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE),
+        ): vol.All(int, vol.Range(min=MIN_MAX_RESPONSE_SIZE, max=MAX_MAX_RESPONSE_SIZE)),
+        vol.Optional(
+            CONF_RESPONSE_ENCODING,
+            default=options.get(CONF_RESPONSE_ENCODING, RESPONSE_ENCODING_AUTO),
+        ): vol.In(RESPONSE_ENCODINGS),
+    }
+    for key, default in DEFAULT_INDEX.items():
+        fields[
+            vol.Optional(key, default=options.get(key, default), description=index_description)
+        ] = int
+    return vol.Schema(fields)
+
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(self, user_input=None):
         if user_input is not None:
             return self.async_create_entry(title="Options", data=user_input)
 
-        oi = self.config_entry.options or {}
+        entry_timeout = min(
+            self.config_entry.data.get("timeout", DEFAULT_TIMEOUT), MAX_ENDPOINT_TIMEOUT
+        )
         errors = {}
-        donnees = {}
+        donnees = self._live_donnees()
+        if not donnees:
+            try:
+                donnees = await self._async_read_donnees()
+            except TimeoutError:
+                errors["base"] = "timeout"
+            except Exception:
+                errors["base"] = "cannot_connect"
 
-        session = async_get_clientsession(self.hass)
-        api = OFoehnApi(
-            host=self.config_entry.data["host"],
-            port=self.config_entry.data.get("port", DEFAULT_PORT),
-            session=session,
-            auth_mode=self.config_entry.data.get("auth_mode", AUTH_NONE),
-            username=self.config_entry.data.get("username"),
-            password=self.config_entry.data.get("password"),
-            login_path=self.config_entry.data.get("login_path", "/login.cgi"),
-            login_method=self.config_entry.data.get("login_method", "POST"),
-            user_field=self.config_entry.data.get("user_field", "user"),
-            pass_field=self.config_entry.data.get("pass_field", "pass"),
-            timeout=min(
-                self.config_entry.data.get("timeout", DEFAULT_TIMEOUT),
-                CONFIG_FLOW_TIMEOUT,
-            ),
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_options_schema(self.config_entry.options or {}, entry_timeout, donnees),
+            errors=errors,
         )
 
-        try:
-            raw = await asyncio.wait_for(
-                api.read_super(retries=0),
-                timeout=CONFIG_FLOW_VALIDATION_MAX,
-            )
-            donnees = parse_donnees(raw)
-        except TimeoutError:
-            errors["base"] = "timeout"
-            donnees = {}
-        except Exception:
-            errors["base"] = "cannot_connect"
-            donnees = {}
-
-        if donnees:
-            select = {
-                "selector": {
-                    "select": {
-                        "options": [
-                            {"value": i, "label": f"{i} ({v})"}
-                            for i, v in sorted(donnees.items())
-                        ]
-                    }
-                }
-            }
-            schema = vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default=oi.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
-                    ): vol.All(int, vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
-                    vol.Optional(
-                        CONF_ENABLE_RAW_SENSORS,
-                        default=oi.get(CONF_ENABLE_RAW_SENSORS, False),
-                    ): bool,
-                    vol.Optional(
-                        "water_in_idx",
-                        default=oi.get("water_in_idx", DEFAULT_INDEX["water_in_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "water_out_idx",
-                        default=oi.get("water_out_idx", DEFAULT_INDEX["water_out_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "air_idx",
-                        default=oi.get("air_idx", DEFAULT_INDEX["air_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "voltage_idx",
-                        default=oi.get("voltage_idx", DEFAULT_INDEX["voltage_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "internal_idx",
-                        default=oi.get("internal_idx", DEFAULT_INDEX["internal_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "pump_idx",
-                        default=oi.get("pump_idx", DEFAULT_INDEX["pump_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "heating_idx",
-                        default=oi.get("heating_idx", DEFAULT_INDEX["heating_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "light_idx",
-                        default=oi.get("light_idx", DEFAULT_INDEX["light_idx"]),
-                        description=select,
-                    ): int,
-                    vol.Optional(
-                        "power_idx",
-                        default=oi.get("power_idx", DEFAULT_INDEX["power_idx"]),
-                        description=select,
-                    ): int,
-                }
-            )
+    def _coordinator(self) -> OFoehnCoordinator | None:
+        info = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        return info["coordinator"] if info else None
+
+    def _live_donnees(self) -> dict[int, float]:
+        """DONNEE values of the running coordinator's last snapshot.
+
+        super.cgi values win over accueil.cgi ones for indices found in both.
+        """
+        coordinator = self._coordinator()
+        snapshot = coordinator.data if coordinator is not None else None
+        if snapshot is None:
+            return {}
+        return {**snapshot.accueil.donnees, **snapshot.super.donnees}
+
+    async def _async_read_donnees(self) -> dict[int, float]:
+        """Read super.cgi when the entry has no snapshot yet (not loaded, first poll pending)."""
+        coordinator = self._coordinator()
+        if coordinator is not None:
+            api = coordinator.api
         else:
-            schema = vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default=oi.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
-                    ): vol.All(int, vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
-                    vol.Optional(
-                        CONF_ENABLE_RAW_SENSORS,
-                        default=oi.get(CONF_ENABLE_RAW_SENSORS, False),
-                    ): bool,
-                    vol.Optional(
-                        "water_in_idx",
-                        default=oi.get("water_in_idx", DEFAULT_INDEX["water_in_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "water_out_idx",
-                        default=oi.get("water_out_idx", DEFAULT_INDEX["water_out_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "air_idx",
-                        default=oi.get("air_idx", DEFAULT_INDEX["air_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "voltage_idx",
-                        default=oi.get("voltage_idx", DEFAULT_INDEX["voltage_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "internal_idx",
-                        default=oi.get("internal_idx", DEFAULT_INDEX["internal_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "pump_idx",
-                        default=oi.get("pump_idx", DEFAULT_INDEX["pump_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "heating_idx",
-                        default=oi.get("heating_idx", DEFAULT_INDEX["heating_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "light_idx",
-                        default=oi.get("light_idx", DEFAULT_INDEX["light_idx"]),
-                    ): int,
-                    vol.Optional(
-                        "power_idx",
-                        default=oi.get("power_idx", DEFAULT_INDEX["power_idx"]),
-                    ): int,
-                }
+            api = OFoehnApi(
+                host=self.config_entry.data["host"],
+                port=self.config_entry.data.get("port", DEFAULT_PORT),
+                session=async_get_clientsession(self.hass),
+                auth_mode=self.config_entry.data.get("auth_mode", AUTH_NONE),
+                username=self.config_entry.data.get("username"),
+                password=self.config_entry.data.get("password"),
+                login_path=self.config_entry.data.get("login_path", "/login.cgi"),
+                login_method=self.config_entry.data.get("login_method", "POST"),
+                user_field=self.config_entry.data.get("user_field", "user"),
+                pass_field=self.config_entry.data.get("pass_field", "pass"),
+                timeout=min(
+                    self.config_entry.data.get("timeout", DEFAULT_TIMEOUT),
+                    CONFIG_FLOW_TIMEOUT,
+                ),
             )
-
-        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+        raw = await asyncio.wait_for(
+            api.read_super(retries=0),
+            timeout=CONFIG_FLOW_VALIDATION_MAX,
+        )
+        return parse_donnees(raw)
@@ -10,6 +10,104 @@ MAX_SCAN_INTERVAL = 300
 
 CONF_ENABLE_RAW_SENSORS = "enable_raw_sensors"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ADAPTIVE_INTERVAL = "adaptive_interval"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+CONF_ACCUEIL_REFRESH_TICKS = "accueil_refresh_ticks"
+CONF_REG_REFRESH_TICKS = "reg_refresh_ticks"
+CONF_SUPER_TIMEOUT = "super_timeout"
+CONF_ACCUEIL_TIMEOUT = "accueil_timeout"
+CONF_REG_TIMEOUT = "reg_timeout"
+CONF_POLL_DEADLINE = "poll_deadline"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_MAX_RESPONSE_SIZE = "max_response_size"
+CONF_RESPONSE_ENCODING = "response_encoding"
+
+# Concurrent reads per device (1 = strictly serial polling)
+DEFAULT_MAX_IN_FLIGHT = 1
+MAX_IN_FLIGHT_LIMIT = 3
+CONCURRENCY_PROBE_ROUNDS = 3
+
+# Optional dedicated HTTP session per device: a single keep-alive connection.
+# Idle sockets closed by the pump's web server are replaced transparently.
+DEVICE_CONNECTION_LIMIT = 1
+DEVICE_KEEPALIVE_TIMEOUT = 60  # seconds
+
+# Response bodies are streamed and abandoned once they pass the size cap (the
+# CGI pages are a few KiB). "auto" decodes with the Content-Type charset, else
+# UTF-8 with a Latin-1 fallback, instead of aiohttp's charset detection.
+DEFAULT_MAX_RESPONSE_SIZE = 64  # KiB
+MIN_MAX_RESPONSE_SIZE = 4
+MAX_MAX_RESPONSE_SIZE = 1024
+RESPONSE_ENCODING_AUTO = "auto"
+RESPONSE_ENCODINGS = [RESPONSE_ENCODING_AUTO, "utf-8", "iso-8859-1"]
+
+# Per-endpoint read timeouts default to the entry timeout. The poll deadline
+# bounds a whole poll cycle: endpoints left when it expires reuse their cached
+# payload instead of waiting.
+MAX_ENDPOINT_TIMEOUT = 60  # seconds
+DEFAULT_POLL_DEADLINE = 20  # seconds
+MIN_POLL_DEADLINE = 5
+MAX_POLL_DEADLINE = 180
+
+# Adaptive polling: MIN_SCAN_INTERVAL for a few polls after a write or a
+# compressor/pump/power change, half the configured interval while the water
+# is within the band of the setpoint, doubling up to MAX_SCAN_INTERVAL while
+# the pump is off or idle.
+ADAPTIVE_FAST_POLLS = 3
+ADAPTIVE_CONVERGING_BAND = 1.0  # °C
+ADAPTIVE_STATE_KEYS = ("compressor_1_on", "pump_on", "power_on")
+
+# Optimistic writes: how long an expected value is shown while the device has
+# not reported it yet, before falling back to the device state.
+OPTIMISTIC_CONFIRM_WINDOW = 30  # seconds
+
+# setReg.cgi writes are debounced and merged into one POST: the window restarts
+# on every new write, up to a maximum delay after the first one.
+SETREG_COALESCE_WINDOW = 0.4  # seconds
+SETREG_COALESCE_MAX_DELAY = 2.0  # seconds
+
+# Circuit breaker: after this many consecutive failed super.cgi reads the
+# device is considered offline. Polls then only send a single probe read, on
+# a jittered exponential schedule, until one succeeds.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 30  # seconds
+BREAKER_MAX_BACKOFF = 900  # seconds
+BREAKER_PROBE_TIMEOUT = 3  # seconds
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Domain-wide poll scheduler: entries are phase-shifted across their interval
+# and at most this many devices are polled at the same time.
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+MAX_CONCURRENT_DEVICE_POLLS = 2
+
+# Poll ticks between reads of the slow endpoints (super.cgi is read every tick).
+# Both are re-read on the next tick after a write that touches them.
+DEFAULT_ACCUEIL_REFRESH_TICKS = 1
+DEFAULT_REG_REFRESH_TICKS = 1
+MAX_REFRESH_TICKS = 60
+
+# Raw sensor attributes are capped and kept out of the recorder; the full
+# payloads are in the config entry diagnostics.
+RAW_ATTRIBUTE_MAX_CHARS = 4096
+RAW_ATTRIBUTE_MAX_LINES = 100
+
+# Poll telemetry kept in memory for the diagnostics download: latency
+# histogram bounds (seconds) and distinct payloads kept per endpoint.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0)
+PAYLOAD_HISTORY = 5
+# Polls covered by the rolling windows of the performance sensors.
+PERF_WINDOW = 60
+
+# Last good payloads persisted per entry and restored (stale) at startup.
+# Saves are delayed so a poll every few seconds does not wear the storage.
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+
+# ofoehn_poolpilot.profile service: poll cycles run per call.
+DEFAULT_PROFILE_CYCLES = 3
+MAX_PROFILE_CYCLES = 10
 
 # Auth modes
 AUTH_NONE = "none"
@@ -1,35 +1,110 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import html
 import logging
+import random
 import re
 import time
-from datetime import timedelta
-from typing import Any, Callable, Optional
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from collections.abc import Mapping
+from typing import Any, Awaitable, Callable, Optional
 from urllib.parse import urlencode
 
-from aiohttp import BasicAuth, ClientError, ClientResponseError, ClientSession
-from homeassistant.core import HomeAssistant
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientPayloadError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    CookieJar,
+    ServerDisconnectedError,
+    TCPConnector,
+    TraceConfig,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from .const import (
+    ADAPTIVE_CONVERGING_BAND,
+    ADAPTIVE_FAST_POLLS,
+    ADAPTIVE_STATE_KEYS,
     AUTH_BASIC,
     AUTH_COOKIE,
     AUTH_NONE,
     AUTH_QUERY,
+    BREAKER_BASE_BACKOFF,
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+    BREAKER_PROBE_TIMEOUT,
+    CONCURRENCY_PROBE_ROUNDS,
+    CONF_ACCUEIL_REFRESH_TICKS,
+    CONF_ACCUEIL_TIMEOUT,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_ENABLE_RAW_SENSORS,
+    CONF_MAX_IN_FLIGHT,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_POLL_DEADLINE,
+    CONF_RESPONSE_ENCODING,
+    CONF_REG_REFRESH_TICKS,
+    CONF_REG_TIMEOUT,
+    CONF_SUPER_TIMEOUT,
+    DEFAULT_ACCUEIL_REFRESH_TICKS,
     DEFAULT_INDEX,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_RESPONSE_SIZE,
+    DEFAULT_POLL_DEADLINE,
+    DEFAULT_REG_REFRESH_TICKS,
     DEFAULT_TIMEOUT,
+    DEVICE_CONNECTION_LIMIT,
+    DEVICE_KEEPALIVE_TIMEOUT,
     ENDPOINTS,
+    MAX_ENDPOINT_TIMEOUT,
+    MAX_IN_FLIGHT_LIMIT,
+    MAX_MAX_RESPONSE_SIZE,
+    MAX_POLL_DEADLINE,
+    MAX_REFRESH_TICKS,
+    MAX_SCAN_INTERVAL,
+    MIN_MAX_RESPONSE_SIZE,
+    MIN_POLL_DEADLINE,
+    MIN_SCAN_INTERVAL,
+    OPTIMISTIC_CONFIRM_WINDOW,
+    RESPONSE_ENCODING_AUTO,
+    SETREG_COALESCE_MAX_DELAY,
+    SETREG_COALESCE_WINDOW,
+    SNAPSHOT_SAVE_DELAY,
+)
+from .snapshot import (
+    AccueilSection,
+    EndpointSection,
+    EntityView,
+    PollSnapshot,
+    RegSection,
+    SuperSection,
 )
+from .profiler import PollProfile
+from .telemetry import PollTelemetry
 
 _LOGGER = logging.getLogger(__name__)
 
 HTML_TAG_RE = re.compile(r"<[^>]+>")
-HTML_LINK_RE = re.compile(r"<a\b[^>]*>(.*?)</a>", re.IGNORECASE | re.DOTALL)
+HTML_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+HTML_LINK_OPEN_RE = re.compile(r"<a\b", re.IGNORECASE)
+HTML_LINK_CLOSE_RE = re.compile(r"</a>", re.IGNORECASE)
 WHITESPACE_RE = re.compile(r"\s+")
+HTML_MARKER_RE = re.compile(r"<html", re.IGNORECASE)
 DONNEE_RE = re.compile(r"DONNEE(\d+)=(-?\d+(?:[.,]\d+)?)")
 FLOAT_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
 FIRMWARE_RE = re.compile(r"Version\s+V?([0-9.]+)", re.IGNORECASE)
+# Query string of a URL quoted in an aiohttp error (credentials in query mode).
+URL_QUERY_RE = re.compile(r"(https?://[^\s'\"?]+)\?[^\s'\")]*")
 ACCUEIL_COMPACT_RE = re.compile(
     r"(?P<mode>Chaud|Froid|Auto|OFF)\s+"
     r"(?P<water_in>-?\d+(?:[.,]\d+)?)°C\s*\(\s*(?P<setpoint>-?\d+(?:[.,]\d+)?)°C\s*\)\s+"
@@ -60,14 +135,63 @@ ACCUEIL_COMPACT_RE = re.compile(
     r"(?P<hardware_code>\S+)",
     re.IGNORECASE,
 )
+# Possessive digit runs that only start at a run boundary: a match can only
+# succeed on a whole run, so this finds the same pairs without the quadratic
+# backtracking on long digit strings.
 TEMP_PAIR_RE = re.compile(
-    r"(-?\d+(?:[.,]\d+)?)\s*(?:°|&deg;)\s*C\s*\(\s*(-?\d+(?:[.,]\d+)?)\s*(?:°|&deg;)?\s*C?\s*\)",
+    r"(-?(?<!\d)\d++(?:[.,]\d++)?)\s*(?:°|&deg;)\s*C\s*\(\s*(-?\d++(?:[.,]\d++)?)\s*(?:°|&deg;)?\s*C?\s*\)",
+    re.IGNORECASE,
+)
+# Every "Label :" of the labelled accueil layout, found in a single scan.
+ACCUEIL_LABEL_RE = re.compile(
+    r"\b(?:(?P<reg_mode_long>Mode de régulation)|(?P<reg_mode>Régulation)|(?P<mode>Mode)"
+    r"|(?P<pump>Pompe)|(?P<heat>Chauffage)|(?P<next_action>Prochaine action)"
+    r"|(?P<general_state>[ÉE]tat général)|(?P<delta_setpoint>Écart consigne)"
+    r"|(?P<air_temp>Température air)|(?P<voltage>Tension)"
+    r"|(?P<internal_temp>Température interne)|(?P<clock>Horloge))\s*:",
+    re.IGNORECASE,
+)
+# Labelled fields: (field, label kinds, value kind, labels ending a text value).
+ACCUEIL_LABELLED_FIELDS: tuple[tuple[str, frozenset[str], str, frozenset[str]], ...] = (
+    ("mode", frozenset({"mode"}), "text",
+     frozenset({"reg_mode_long", "pump", "next_action", "general_state"})),
+    ("reg_mode", frozenset({"reg_mode_long", "reg_mode"}), "text",
+     frozenset({"pump", "next_action", "general_state"})),
+    ("pump", frozenset({"pump"}), "text",
+     frozenset({"heat", "next_action", "general_state"})),
+    ("heat", frozenset({"heat"}), "text",
+     frozenset({"next_action", "general_state"})),
+    ("next_action", frozenset({"next_action"}), "text",
+     frozenset({"general_state", "air_temp", "voltage", "clock"})),
+    ("general_state", frozenset({"general_state"}), "text",
+     frozenset({"air_temp", "voltage", "clock"})),
+    ("delta_setpoint", frozenset({"delta_setpoint"}), "number", frozenset()),
+    ("air_temp", frozenset({"air_temp"}), "number", frozenset()),
+    ("voltage", frozenset({"voltage"}), "number", frozenset()),
+    ("internal_temp", frozenset({"internal_temp"}), "number", frozenset()),
+    ("clock", frozenset({"clock"}), "rest", frozenset()),
+)
+LABEL_NUMBER_RE = re.compile(r"-?[0-9.,]+")
+ACCUEIL_STATE_RE = re.compile(r"\b(ON|OFF)\b", re.IGNORECASE)
+ACCUEIL_NEXT_ACTION_RE = re.compile(
+    r"\b(Aucune|Aucun|Arrêté|Arrete|Arrêt|Arret|Non \(Automne\))\b",
     re.IGNORECASE,
 )
+# The compact layout is only searched in a bounded window around its
+# "TIMER(s)" marker, which keeps its backtracking cost constant per candidate.
+ACCUEIL_COMPACT_ANCHOR_RE = re.compile(r"TIMER\(s\)", re.IGNORECASE)
+ACCUEIL_COMPACT_WINDOW = 512
+ACCUEIL_COMPACT_MAX_CANDIDATES = 4
 
 READ_RETRIES = 0
 READ_RETRY_DELAY = 0.75
 INTER_REQUEST_DELAY = 0.15
+# (snapshot key, log name, OFoehnApi reader) for each polled endpoint, in poll order.
+POLL_ENDPOINTS = (
+    ("super", "super.cgi", "read_super"),
+    ("accueil", "accueil.cgi", "read_accueil"),
+    ("reg", "getReg.cgi", "read_reg"),
+)
 POLL_ERROR_LOG_COOLDOWN = 300  # seconds between repeated poll-failure warnings
 RETRYABLE_HTTP_STATUSES = {408, 425, 429, 500, 502, 503, 504}
 AUTH_ERROR_STATUSES = {401, 403}
@@ -78,8 +202,12 @@ def clean_html_text(raw: str | None) -> str:
     if not raw:
         return ""
     text = html.unescape(raw)
-    text = re.sub(r"(?i)<br\s*/?>", "\n", text)
-    text = HTML_TAG_RE.sub(" ", text)
+    text = HTML_BR_RE.sub("\n", text)
+    last_close = text.rfind(">")
+    if last_close >= 0:
+        # No tag can start after the last ">", so leave that tail alone instead
+        # of letting every stray "<" in it scan to the end of the payload.
+        text = HTML_TAG_RE.sub(" ", text[: last_close + 1]) + text[last_close + 1 :]
     text = text.replace("\xa0", " ")
     return WHITESPACE_RE.sub(" ", text).strip()
 
@@ -92,6 +220,11 @@ def clean_html_lines(raw: str | None) -> list[str]:
     return [line for line in lines if line]
 
 
+def _payload_digest(raw: str | None) -> bytes:
+    """Return a short content digest used to detect unchanged payloads."""
+    return hashlib.blake2b((raw or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
 def _to_float(value: str | None) -> float | None:
     if value is None:
         return None
@@ -127,11 +260,24 @@ def _normalize_mode(value: str | None) -> str | None:
 
 
 def _extract_anchor_texts(raw: str) -> list[str]:
+    """Return the text of every <a>…</a> link, scanning the payload once."""
     values: list[str] = []
-    for match in HTML_LINK_RE.finditer(raw or ""):
-        text = clean_html_text(match.group(1))
+    raw = raw or ""
+    pos = 0
+    while True:
+        opening = HTML_LINK_OPEN_RE.search(raw, pos)
+        if opening is None:
+            break
+        body_start = raw.find(">", opening.end())
+        if body_start < 0:
+            break
+        closing = HTML_LINK_CLOSE_RE.search(raw, body_start + 1)
+        if closing is None:
+            break
+        text = clean_html_text(raw[body_start + 1 : closing.start()])
         if text:
             values.append(text)
+        pos = closing.end()
     return values
 
 
@@ -149,7 +295,7 @@ def _is_enabled_text(value: str | None) -> bool | None:
 
 def parse_page_metadata(raw: str) -> dict[str, Any]:
     """Extract metadata when a payload contains an HTML page."""
-    if not raw or "<html" not in raw.lower():
+    if not raw or not HTML_MARKER_RE.search(raw):
         return {}
 
     result: dict[str, Any] = {}
@@ -228,84 +374,207 @@ def parse_accueil_values(raw: str) -> dict[str, Any]:
     return {key: value for key, value in result.items() if value is not None}
 
 
+def _clean_line(line: str) -> str:
+    """clean_html_text() for one line, skipping the HTML work on plain lines."""
+    if "<" not in line and "&" not in line:
+        # Same result as clean_html_text(): str.split() and \s agree on whitespace.
+        return " ".join(line.split())
+    return clean_html_text(line)
+
+
+def _slot_text(value: str | None) -> str | None:
+    return value
+
+
+def _webuser_role(value: str | None) -> str | None:
+    if value == "0":
+        return "Utilisateur"
+    return "Installateur/Admin" if value else None
+
+
+def _ev_present(value: str | None) -> str | None:
+    if value == "1":
+        return "Oui"
+    return "Non" if value is not None else None
+
+
+# super.cgi answers one value per line: (field, line index, converter).
+SUPER_SLOTS: tuple[tuple[str, int, Callable[[str | None], Any]], ...] = (
+    ("contact_bp1", 0, _slot_text),
+    ("contact_bp2", 1, _slot_text),
+    ("contact_hp1", 2, _slot_text),
+    ("contact_hp2", 3, _slot_text),
+    ("balneo_state", 4, _slot_text),
+    ("water_in", 5, _extract_float),
+    ("water_out", 6, _extract_float),
+    ("air_temp", 7, _extract_float),
+    ("compressor_1_temp", 8, _extract_float),
+    ("battery_1_temp", 9, _extract_float),
+    ("compressor_2_temp", 10, _extract_float),
+    ("battery_2_temp", 11, _extract_float),
+    ("pressure_1", 12, _extract_float),
+    ("pressure_2", 13, _extract_float),
+    ("chlorine_state", 14, _slot_text),
+    ("ph_state", 15, _slot_text),
+    ("pump_state", 16, _slot_text),
+    ("pump_on", 16, _is_enabled_text),
+    ("fan_state", 17, _slot_text),
+    ("valve_1_state", 18, _slot_text),
+    ("compressor_1_state", 19, _slot_text),
+    ("compressor_1_on", 19, _is_enabled_text),
+    ("valve_2_state", 20, _slot_text),
+    ("compressor_2_state", 21, _slot_text),
+    ("compressor_2_on", 21, _is_enabled_text),
+    ("webuser_type", 22, _slot_text),
+    ("webuser_role", 22, _webuser_role),
+    ("power_state", 23, _slot_text),
+    ("power_on", 23, _is_enabled_text),
+    ("ev_present", 24, _ev_present),
+    ("ext2_temp", 25, _extract_float),
+    ("superheat", 26, _extract_float),
+    ("ev_position", 27, _slot_text),
+    ("gas_temp", 28, _extract_float),
+    ("delta", 29, _extract_float),
+    ("ph_license", 30, _slot_text),
+)
+SUPER_MIN_LINES = 24
+
+
+def parse_super_payload(raw: str) -> tuple[dict[str, Any], dict[int, float], dict[str, Any]]:
+    """Parse super.cgi in one pass over its lines.
+
+    Returns the line fields, the DONNEE map and the page metadata, exactly as
+    parse_donnees() and parse_page_metadata() would read the same payload.
+    """
+    donnees: dict[int, float] = {}
+    lines: list[str] = []
+    is_html = bool(raw) and HTML_MARKER_RE.search(raw) is not None
+
+    for line in (raw or "").splitlines():
+        if "DONNEE" in line:
+            for m in DONNEE_RE.finditer(line):
+                try:
+                    donnees[int(m.group(1))] = float(m.group(2).replace(",", "."))
+                except (TypeError, ValueError):
+                    _LOGGER.debug("Error parsing donnees entry: %s", m.group(0))
+        if not is_html:
+            text = _clean_line(line)
+            if text:
+                lines.append(text)
+    if not donnees:
+        _LOGGER.debug("No donnees parsed from: %s", raw)
+
+    metadata: dict[str, Any] = {}
+    if is_html:
+        firmware_match = FIRMWARE_RE.search(raw)
+        if firmware_match:
+            metadata["firmware_version"] = f"V{firmware_match.group(1)}"
+
+    if len(lines) < SUPER_MIN_LINES:
+        return {}, donnees, metadata
+    count = len(lines)
+    values = {
+        key: convert(lines[index] if index < count else None)
+        for key, index, convert in SUPER_SLOTS
+    }
+    return values, donnees, metadata
+
+
 def parse_super_values(raw: str) -> dict[str, Any]:
     """Parse the line-oriented payload used by the supervision page."""
-    if not raw or "<html" in raw.lower():
-        return {}
+    return parse_super_payload(raw)[0]
 
-    lines = [clean_html_text(line) for line in raw.splitlines()]
-    lines = [line for line in lines if line]
-    if len(lines) < 24:
-        return {}
 
-    def text_at(index: int) -> str | None:
-        return lines[index] if index < len(lines) else None
+class ResponseTooLarge(ClientPayloadError):
+    """The response body passed the configured size cap."""
 
-    def float_at(index: int) -> float | None:
-        value = text_at(index)
-        if not value:
-            return None
-        match = FLOAT_RE.search(value)
-        if not match:
-            return None
-        return _to_float(match.group(0))
 
-    webuser_type = text_at(22)
-    ev_raw = text_at(24)
+def _fail_waiters(waiters: list[asyncio.Future[bool]], err: BaseException) -> None:
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_exception(err)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with jittered exponential probe backoff."""
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff: float = BREAKER_BASE_BACKOFF,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.probes = 0
+        self.short_circuited = 0
+        self.opened_at: float | None = None
+        self.next_probe_at: float | None = None
+        self._attempt = 0
+
+    def record_success(self) -> bool:
+        """Reset the failure count; return True when this closed the breaker."""
+        was_open = self.state != BREAKER_CLOSED
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.next_probe_at = None
+        self._attempt = 0
+        return was_open
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True when this tripped a closed breaker."""
+        self.failures += 1
+        if self.state == BREAKER_CLOSED:
+            if self.failures < self.threshold:
+                return False
+            self.trips += 1
+            self.opened_at = time.monotonic()
+            tripped = True
+        else:
+            self._attempt += 1
+            tripped = False
+        self.state = BREAKER_OPEN
+        delay = min(self.max_backoff, self.base_backoff * 2**self._attempt)
+        # Equal jitter: keeps at least half the backoff, spreads the rest so
+        # several offline pumps do not probe in lockstep.
+        self.next_probe_at = time.monotonic() + delay / 2 + random.uniform(0, delay / 2)
+        return tripped
+
+    def probe_due(self) -> bool:
+        return self.next_probe_at is None or time.monotonic() >= self.next_probe_at
+
+    def begin_probe(self) -> None:
+        self.state = BREAKER_HALF_OPEN
+        self.probes += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "probes": self.probes,
+            "short_circuited_polls": self.short_circuited,
+            "open_for": round(now - self.opened_at, 1) if self.opened_at is not None else None,
+            "next_probe_in": (
+                round(max(0.0, self.next_probe_at - now), 1)
+                if self.next_probe_at is not None
+                else None
+            ),
+        }
 
-    return {
-        "contact_bp1": text_at(0),
-        "contact_bp2": text_at(1),
-        "contact_hp1": text_at(2),
-        "contact_hp2": text_at(3),
-        "balneo_state": text_at(4),
-        "water_in": float_at(5),
-        "water_out": float_at(6),
-        "air_temp": float_at(7),
-        "compressor_1_temp": float_at(8),
-        "battery_1_temp": float_at(9),
-        "compressor_2_temp": float_at(10),
-        "battery_2_temp": float_at(11),
-        "pressure_1": float_at(12),
-        "pressure_2": float_at(13),
-        "chlorine_state": text_at(14),
-        "ph_state": text_at(15),
-        "pump_state": text_at(16),
-        "pump_on": _is_enabled_text(text_at(16)),
-        "fan_state": text_at(17),
-        "valve_1_state": text_at(18),
-        "compressor_1_state": text_at(19),
-        "compressor_1_on": _is_enabled_text(text_at(19)),
-        "valve_2_state": text_at(20),
-        "compressor_2_state": text_at(21),
-        "compressor_2_on": _is_enabled_text(text_at(21)),
-        "webuser_type": webuser_type,
-        "webuser_role": (
-            "Utilisateur"
-            if webuser_type == "0"
-            else "Installateur/Admin"
-            if webuser_type
-            else None
-        ),
-        "power_state": text_at(23),
-        "power_on": _is_enabled_text(text_at(23)),
-        "ev_present": (
-            "Oui" if ev_raw == "1" else "Non" if ev_raw is not None else None
-        ),
-        "ext2_temp": float_at(25),
-        "superheat": float_at(26),
-        "ev_position": text_at(27),
-        "gas_temp": float_at(28),
-        "delta": float_at(29),
-        "ph_license": text_at(30),
-    }
 
 class OFoehnApi:
     def __init__(
         self,
         host: str,
         port: int,
-        session: ClientSession,
+        session: ClientSession | None,
         auth_mode: str = AUTH_NONE,
         username: Optional[str] = None,
         password: Optional[str] = None,
@@ -314,9 +583,13 @@ class OFoehnApi:
         user_field: str = "user",
         pass_field: str = "pass",
         timeout: int = DEFAULT_TIMEOUT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ) -> None:
         self._base = f"http://{host}:{port}"
-        self._session = session
+        # Without a shared session the API owns one keep-alive connection.
+        self.connection_stats: dict[str, int] | None = None
+        self._owns_session = session is None
+        self._session = session if session is not None else self._create_session()
         self._auth_mode = auth_mode
         self._username = username
         self._password = password
@@ -326,15 +599,102 @@ class OFoehnApi:
         self._pass_field = pass_field
         self._basic_auth = BasicAuth(username, password) if (auth_mode == AUTH_BASIC and username) else None
         self._timeout = timeout
+        self._read_timeouts: dict[str, int] = {}
         self._cookie_logged_in = False
-        self._request_lock = asyncio.Lock()
+        self._max_in_flight = DEFAULT_MAX_IN_FLIGHT
+        self._request_slots = asyncio.Semaphore(DEFAULT_MAX_IN_FLIGHT)
         self._login_lock = asyncio.Lock()
+        self._dirty_endpoints: set[str] = set()
+        self.breaker = CircuitBreaker()
+        self._reg_pending: dict[str, Any] = {}
+        self._reg_waiters: list[asyncio.Future[bool]] = []
+        self._reg_batch_started = 0.0
+        self._reg_flush: asyncio.TimerHandle | None = None
+        # POSTs in flight; a batch may flush while the previous one is still sent.
+        self._reg_send_tasks: set[asyncio.Task] = set()
+        self.write_stats: dict[str, Any] = {
+            "posts": 0,
+            "failed_posts": 0,
+            "merged": 0,
+            "last_latency": None,
+            "max_latency": 0.0,
+        }
+        self._max_response_bytes = DEFAULT_MAX_RESPONSE_SIZE * 1024
+        self._response_encoding = RESPONSE_ENCODING_AUTO
+        # Per endpoint page (e.g. "super.cgi"): bytes read and decode time.
+        self.body_stats: dict[str, dict[str, Any]] = {}
+        self.set_max_in_flight(max_in_flight)
+
+    def _create_session(self) -> ClientSession:
+        stats = self.connection_stats = {"created": 0, "reused": 0, "reconnects": 0}
+
+        async def on_connection_create_end(session, context, params) -> None:
+            stats["created"] += 1
+
+        async def on_connection_reuseconn(session, context, params) -> None:
+            stats["reused"] += 1
+
+        trace = TraceConfig()
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return ClientSession(
+            connector=TCPConnector(
+                limit=DEVICE_CONNECTION_LIMIT,
+                keepalive_timeout=DEVICE_KEEPALIVE_TIMEOUT,
+            ),
+            # The pump is addressed by IP, which the default jar refuses cookies for.
+            cookie_jar=CookieJar(unsafe=True),
+            trace_configs=[trace],
+        )
+
+    async def async_close(self) -> None:
+        """Drop pending writes and close the dedicated session, if this API created one."""
+        if self._reg_flush is not None:
+            self._reg_flush.cancel()
+            self._reg_flush = None
+        waiters, self._reg_waiters, self._reg_pending = self._reg_waiters, [], {}
+        _fail_waiters(waiters, HomeAssistantError("Integration unloaded before the write was sent"))
+        tasks = list(self._reg_send_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_session:
+            await self._session.close()
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def set_max_in_flight(self, value: Any) -> None:
+        """Limit how many requests may be in flight against the device."""
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            limit = DEFAULT_MAX_IN_FLIGHT
+        limit = max(1, min(MAX_IN_FLIGHT_LIMIT, limit))
+        if limit == self._max_in_flight:
+            return
+        # Requests already holding a slot finish on the previous semaphore.
+        self._max_in_flight = limit
+        self._request_slots = asyncio.Semaphore(limit)
 
     async def prepare_for_reads(self) -> None:
         """Ensure auth is ready before a polling batch."""
         if self._auth_mode == AUTH_COOKIE:
             await self._maybe_login()
 
+    def describe_error(self, err: BaseException) -> str:
+        """Text of a request error, without URL queries or the credentials.
+
+        aiohttp quotes the full request URL, which holds the login in query
+        auth mode; this is the only form stored in snapshots and telemetry.
+        """
+        text = URL_QUERY_RE.sub(r"\1", str(err)) or err.__class__.__name__
+        for secret in (self._password, self._username):
+            if secret:
+                text = text.replace(secret, "***")
+        return text
+
     def _url(self, path: str, query: dict[str, Any] | None = None) -> str:
         url = self._base + path
         if self._auth_mode == AUTH_QUERY and self._username and self._password:
@@ -376,18 +736,24 @@ class OFoehnApi:
         data: Any | None = None,
         query: dict[str, Any] | None = None,
         retries: int = 0,
+        slots: asyncio.Semaphore | None = None,
+        timeout: int | None = None,
+        idempotent: bool = True,
     ) -> str:
-        async with self._request_lock:
+        async with slots or self._request_slots:
             url = self._url(path, query=query)
             auth_retry_done = False
+            reconnect_done = False
             attempt = 0
 
             while attempt <= retries:
                 try:
                     if method == "GET":
-                        async with self._session.get(url, timeout=self._timeout, auth=self._basic_auth) as resp:
+                        async with self._session.get(
+                            url, timeout=timeout or self._timeout, auth=self._basic_auth
+                        ) as resp:
                             resp.raise_for_status()
-                            return await resp.text()
+                            return await self._read_body(resp, path)
 
                     payload = data
                     if self._auth_mode == AUTH_QUERY and self._username and self._password:
@@ -398,11 +764,13 @@ class OFoehnApi:
                     async with self._session.post(
                         url,
                         data=payload or {},
-                        timeout=self._timeout,
+                        timeout=timeout or self._timeout,
                         auth=self._basic_auth,
                     ) as resp:
                         resp.raise_for_status()
-                        return await resp.text()
+                        return await self._read_body(resp, path)
+                except ResponseTooLarge:
+                    raise
                 except ClientResponseError as err:
                     if (
                         err.status in AUTH_ERROR_STATUSES
@@ -428,6 +796,20 @@ class OFoehnApi:
                         retries,
                     )
                     await asyncio.sleep(delay)
+                except ServerDisconnectedError as err:
+                    # A kept-alive socket the pump closed while idle: replay
+                    # once on a fresh connection, outside the retry budget.
+                    if not idempotent or reconnect_done:
+                        raise
+                    reconnect_done = True
+                    if self.connection_stats is not None:
+                        self.connection_stats["reconnects"] += 1
+                    _LOGGER.debug(
+                        "Connection to %s dropped (%s), reconnecting",
+                        path,
+                        self.describe_error(err),
+                    )
+                    continue
                 except (ClientError, asyncio.TimeoutError, OSError) as err:
                     if method != "GET" or attempt >= retries:
                         raise
@@ -436,7 +818,7 @@ class OFoehnApi:
                     _LOGGER.debug(
                         "Read %s failed (%s), retrying in %.2fs (%s/%s)",
                         path,
-                        err,
+                        self.describe_error(err),
                         delay,
                         attempt,
                         retries,
@@ -445,6 +827,64 @@ class OFoehnApi:
 
             raise UpdateFailed(f"Unable to read {path}")
 
+    def set_body_limits(self, max_size: Any, encoding: Any) -> None:
+        """Set the response size cap (KiB) and the page encoding ("auto" or a codec)."""
+        try:
+            kib = int(max_size)
+        except (TypeError, ValueError):
+            kib = DEFAULT_MAX_RESPONSE_SIZE
+        self._max_response_bytes = max(MIN_MAX_RESPONSE_SIZE, min(MAX_MAX_RESPONSE_SIZE, kib)) * 1024
+        self._response_encoding = encoding or RESPONSE_ENCODING_AUTO
+
+    async def _read_body(self, resp: ClientResponse, path: str) -> str:
+        """Stream the body up to the size cap and decode it without charset sniffing."""
+        limit = self._max_response_bytes
+        if resp.content_length is not None and resp.content_length > limit:
+            raise ResponseTooLarge(f"{path} announces {resp.content_length} bytes, limit is {limit}")
+        body = bytearray()
+        async for chunk in resp.content.iter_any():
+            body += chunk
+            if len(body) > limit:
+                raise ResponseTooLarge(f"{path} passed {limit} bytes, response abandoned")
+        started = time.perf_counter()
+        text = self._decode(body, resp.charset)
+        elapsed = time.perf_counter() - started
+        stats = self.body_stats.setdefault(
+            path.lstrip("/"),
+            {"reads": 0, "bytes": 0, "total_bytes": 0, "decode_ms": 0.0, "max_decode_ms": 0.0},
+        )
+        stats["reads"] += 1
+        stats["bytes"] = len(body)
+        stats["total_bytes"] += len(body)
+        stats["decode_ms"] = round(elapsed * 1000, 3)
+        stats["max_decode_ms"] = max(stats["max_decode_ms"], stats["decode_ms"])
+        return text
+
+    def _decode(self, body: bytearray, charset: str | None) -> str:
+        encoding = self._response_encoding
+        if encoding != RESPONSE_ENCODING_AUTO:
+            return body.decode(encoding, errors="replace")
+        if charset:
+            try:
+                return body.decode(charset, errors="replace")
+            except LookupError:
+                pass
+        try:
+            return body.decode("utf-8")
+        except UnicodeDecodeError:
+            # Latin-1 maps every byte, so older firmwares never fail to decode.
+            return body.decode("iso-8859-1")
+
+    def set_read_timeouts(self, timeouts: dict[str, Any]) -> None:
+        """Set per-endpoint read timeouts (super, accueil, reg); None keeps the default."""
+        self._read_timeouts = {}
+        for key, value in timeouts.items():
+            try:
+                seconds = int(value)
+            except (TypeError, ValueError):
+                continue
+            self._read_timeouts[key] = max(1, min(MAX_ENDPOINT_TIMEOUT, seconds))
+
     # Reads
     async def read_super(self, *, retries: int | None = None) -> str:
         if self._auth_mode == AUTH_COOKIE:
@@ -453,6 +893,7 @@ class OFoehnApi:
             "GET",
             ENDPOINTS["super"],
             retries=READ_RETRIES if retries is None else retries,
+            timeout=self._read_timeouts.get("super"),
         )
 
     async def read_accueil(self, *, retries: int | None = None) -> str:
@@ -462,6 +903,7 @@ class OFoehnApi:
             "GET",
             ENDPOINTS["accueil"],
             retries=READ_RETRIES if retries is None else retries,
+            timeout=self._read_timeouts.get("accueil"),
         )
 
     async def read_reg(self, *, retries: int | None = None) -> str:
@@ -471,23 +913,120 @@ class OFoehnApi:
             "GET",
             ENDPOINTS["reg_get"],
             retries=READ_RETRIES if retries is None else retries,
+            timeout=self._read_timeouts.get("reg"),
         )
 
+    def mark_dirty(self, *endpoints: str) -> None:
+        """Flag poll endpoints whose content is expected to change."""
+        self._dirty_endpoints.update(endpoints)
+
+    def discard_dirty(self, endpoints: set[str]) -> None:
+        """Forget write marks for endpoints that were just re-read."""
+        self._dirty_endpoints -= endpoints
+
+    def pop_dirty_endpoints(self) -> set[str]:
+        """Return and clear the endpoints touched by writes since the last poll."""
+        dirty = self._dirty_endpoints
+        self._dirty_endpoints = set()
+        return dirty
+
     # Writes
-    async def set_mode(self, mode: str) -> None:
-        await self._fetch("POST", ENDPOINTS["reg_set"], data={"mode": mode})
+    @property
+    def queued_writes(self) -> int:
+        """setReg.cgi writes waiting for the current debounce window."""
+        return len(self._reg_waiters)
+
+    async def _queue_reg_write(self, data: dict[str, Any]) -> bool:
+        """Merge a setReg.cgi write into the pending batch and wait for its POST.
+
+        Later values win for the same field, so mode and setpoint changes made
+        within the window go out in one POST with the last setpoint. Returns
+        True for the call that closed the batch, False for calls merged into it.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._reg_waiters:
+            self.write_stats["merged"] += 1
+        else:
+            self._reg_batch_started = now
+        self._reg_pending.update(data)
+        waiter: asyncio.Future[bool] = loop.create_future()
+        self._reg_waiters.append(waiter)
+        if self._reg_flush is not None:
+            self._reg_flush.cancel()
+        self._reg_flush = loop.call_at(
+            min(now + SETREG_COALESCE_WINDOW, self._reg_batch_started + SETREG_COALESCE_MAX_DELAY),
+            self._flush_reg_writes,
+        )
+        return await waiter
+
+    def _flush_reg_writes(self) -> None:
+        data, waiters = self._reg_pending, self._reg_waiters
+        self._reg_pending, self._reg_waiters = {}, []
+        self._reg_flush = None
+        task = asyncio.get_running_loop().create_task(
+            self._send_reg_batch(data, waiters, self._reg_batch_started)
+        )
+        self._reg_send_tasks.add(task)
+        task.add_done_callback(self._reg_send_tasks.discard)
 
-    async def set_setpoint(self, temp: float) -> None:
+    async def _send_reg_batch(
+        self,
+        data: dict[str, Any],
+        waiters: list[asyncio.Future[bool]],
+        started: float,
+    ) -> None:
+        sent = False
+        try:
+            await self._fetch("POST", ENDPOINTS["reg_set"], data=data)
+            sent = True
+        except Exception as err:
+            _fail_waiters(waiters, err)
+        else:
+            # Latency of the writes that reached the pump only.
+            latency = asyncio.get_running_loop().time() - started
+            self.write_stats["last_latency"] = round(latency, 3)
+            self.write_stats["max_latency"] = round(max(self.write_stats["max_latency"], latency), 3)
+            for position, waiter in enumerate(waiters, 1):
+                if not waiter.done():
+                    waiter.set_result(position == len(waiters))
+        finally:
+            # Cancelled mid-POST (unload): the callers must not wait forever.
+            _fail_waiters(waiters, HomeAssistantError("setReg.cgi write was cancelled"))
+            self.mark_dirty("reg", "accueil")
+            self.write_stats["posts" if sent else "failed_posts"] += 1
+
+    async def set_mode(self, mode: str) -> bool:
+        return await self._queue_reg_write({"mode": mode})
+
+    async def set_setpoint(self, temp: float) -> bool:
         t = f"{temp:.1f}"
-        data = {"consigneFroid": t, "consigneChaud": t, "consigneAuto": t}
-        await self._fetch("POST", ENDPOINTS["reg_set"], data=data)
+        return await self._queue_reg_write(
+            {"consigneFroid": t, "consigneChaud": t, "consigneAuto": t}
+        )
 
     async def toggle_power(self) -> None:
-        await self._fetch("GET", ENDPOINTS["toggle"])
+        try:
+            await self._fetch("GET", ENDPOINTS["toggle"], idempotent=False)
+        finally:
+            self.mark_dirty("accueil", "reg")
 
     async def set_light(self, on: bool) -> None:
         payload = "1" if on else "0"
-        await self._fetch("POST", ENDPOINTS["light"], data=payload)
+        try:
+            await self._fetch("POST", ENDPOINTS["light"], data=payload, idempotent=False)
+        finally:
+            self.mark_dirty("accueil")
+
+    async def probe(self) -> None:
+        """Cheap reachability check for the circuit breaker's half-open state."""
+        await self.prepare_for_reads()
+        await self._fetch(
+            "GET",
+            ENDPOINTS["super"],
+            retries=0,
+            timeout=min(self._timeout, BREAKER_PROBE_TIMEOUT),
+        )
 
     async def check_connection(self) -> bool:
         """Perform a lightweight request to verify connectivity."""
@@ -498,30 +1037,117 @@ class OFoehnApi:
         except Exception:
             return False
 
+    async def probe_concurrency(
+        self,
+        max_level: int = MAX_IN_FLIGHT_LIMIT,
+        rounds: int = CONCURRENCY_PROBE_ROUNDS,
+    ) -> dict[str, Any]:
+        """Measure how many simultaneous reads the device web server tolerates.
+
+        Each level issues that many reads at once (cycling through the poll
+        endpoints) for a few rounds, bypassing the configured in-flight limit.
+        The highest level that completed without a single error is recommended.
+        """
+        await self.prepare_for_reads()
+        paths = (ENDPOINTS["super"], ENDPOINTS["accueil"], ENDPOINTS["reg_get"])
+        levels: dict[int, dict[str, Any]] = {}
+        recommended = 1
+        for level in range(1, max(1, min(MAX_IN_FLIGHT_LIMIT, max_level)) + 1):
+            slots = asyncio.Semaphore(level)
+            ok = 0
+            errors: list[str] = []
+            started = time.monotonic()
+            for _ in range(max(1, rounds)):
+                results = await asyncio.gather(
+                    *(
+                        self._fetch("GET", paths[i % len(paths)], slots=slots)
+                        for i in range(level)
+                    ),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        errors.append(f"{type(result).__name__}: {result}")
+                    else:
+                        ok += 1
+            elapsed = time.monotonic() - started
+            levels[level] = {
+                "requests": ok + len(errors),
+                "ok": ok,
+                "failed": len(errors),
+                "errors": errors[:5],
+                "elapsed": round(elapsed, 3),
+                "avg_round": round(elapsed / max(1, rounds), 3),
+            }
+            if errors:
+                break
+            recommended = level
+        return {"levels": levels, "recommended": recommended}
+
+
+def _parse_accueil_labels(plain: str) -> dict[str, str]:
+    """Read the "Label : value" fields of the labelled accueil layout.
+
+    The labels are tokenized in one pass; a text value runs until the next
+    label (preceded by whitespace) that may follow it, or the end of the text.
+    """
+    tokens = [
+        (match.lastgroup, match.start(), match.end())
+        for match in ACCUEIL_LABEL_RE.finditer(plain)
+    ]
+    size = len(plain)
+    values: dict[str, str] = {}
+    for key, kinds, value_kind, terminators in ACCUEIL_LABELLED_FIELDS:
+        for position, (kind, _, label_end) in enumerate(tokens):
+            if kind not in kinds:
+                continue
+            value_start = label_end
+            while value_start < size and plain[value_start].isspace():
+                value_start += 1
+            if value_kind == "number":
+                number = LABEL_NUMBER_RE.match(plain, value_start)
+                if number is None:
+                    continue
+                values[key] = number.group(0)
+                break
+            if value_start >= size:
+                continue
+            value_end = size
+            if value_kind == "text":
+                for next_kind, next_start, _ in tokens[position + 1 :]:
+                    if (
+                        next_kind in terminators
+                        and next_start > value_start
+                        and plain[next_start - 1].isspace()
+                    ):
+                        value_end = next_start
+                        break
+            values[key] = plain[value_start:value_end].strip()
+            break
+    return values
+
+
+def _search_accueil_compact(plain: str) -> re.Match[str] | None:
+    """Find the compact accueil layout near one of its "TIMER(s)" markers."""
+    for candidate, anchor in enumerate(ACCUEIL_COMPACT_ANCHOR_RE.finditer(plain)):
+        if candidate >= ACCUEIL_COMPACT_MAX_CANDIDATES:
+            break
+        window_end = plain.find(" ", anchor.end() + ACCUEIL_COMPACT_WINDOW)
+        match = ACCUEIL_COMPACT_RE.search(
+            plain,
+            max(0, anchor.start() - ACCUEIL_COMPACT_WINDOW),
+            len(plain) if window_end < 0 else window_end,
+        )
+        if match is not None:
+            return match
+    return None
+
 
 def parse_accueil_html(raw: str) -> dict[str, Any]:
     plain = clean_html_text(raw)
     result: dict[str, Any] = parse_accueil_values(raw)
 
-    patterns = {
-        "mode": r"\bMode\s*:\s*(.+?)(?=\s+Mode de régulation\s*:|\s+Pompe\s*:|\s+Prochaine action\s*:|\s+État général\s*:|\s+Etat général\s*:|$)",
-        "reg_mode": r"\b(?:Mode de régulation|Régulation)\s*:\s*(.+?)(?=\s+Pompe\s*:|\s+Prochaine action\s*:|\s+État général\s*:|\s+Etat général\s*:|$)",
-        "pump": r"\bPompe\s*:\s*(.+?)(?=\s+Chauffage\s*:|\s+Prochaine action\s*:|\s+État général\s*:|\s+Etat général\s*:|$)",
-        "heat": r"\bChauffage\s*:\s*(.+?)(?=\s+Prochaine action\s*:|\s+État général\s*:|\s+Etat général\s*:|$)",
-        "next_action": r"\bProchaine action\s*:\s*(.+?)(?=\s+État général\s*:|\s+Etat général\s*:|\s+Température air\s*:|\s+Tension\s*:|\s+Horloge\s*:|$)",
-        "general_state": r"\b(?:État général|Etat général)\s*:\s*(.+?)(?=\s+Température air\s*:|\s+Tension\s*:|\s+Horloge\s*:|$)",
-        "delta_setpoint": r"\bÉcart consigne\s*:\s*(-?[0-9.,]+)",
-        "air_temp": r"\bTempérature air\s*:\s*(-?[0-9.,]+)",
-        "voltage": r"\bTension\s*:\s*(-?[0-9.,]+)",
-        "internal_temp": r"\bTempérature interne\s*:\s*(-?[0-9.,]+)",
-        "clock": r"\bHorloge\s*:\s*(.+)$",
-    }
-
-    for key, pattern in patterns.items():
-        m = re.search(pattern, plain, re.IGNORECASE)
-        if not m:
-            continue
-        value = m.group(1).strip()
+    for key, value in _parse_accueil_labels(plain).items():
         if key in {"delta_setpoint", "air_temp", "voltage", "internal_temp"}:
             try:
                 result[key] = float(value.replace(",", "."))
@@ -544,7 +1170,11 @@ def parse_accueil_html(raw: str) -> dict[str, Any]:
         if not result.get("reg_mode") and len(anchor_texts) > 1:
             result["reg_mode"] = anchor_texts[1]
 
-    match = TEMP_PAIR_RE.search(raw) or TEMP_PAIR_RE.search(plain)
+    match = TEMP_PAIR_RE.search(raw)
+    if match is None and ("<" in raw or "&" in raw):
+        # Without markup the plain text only differs by whitespace, which
+        # TEMP_PAIR_RE already tolerates.
+        match = TEMP_PAIR_RE.search(plain)
     if match:
         water_in = _to_float(match.group(1))
         setpoint = _to_float(match.group(2))
@@ -556,20 +1186,16 @@ def parse_accueil_html(raw: str) -> dict[str, Any]:
             _LOGGER.debug("Error parsing water values from accueil HTML: %s", raw)
 
     if not result.get("general_state"):
-        state_matches = re.findall(r"\b(ON|OFF)\b", plain, re.IGNORECASE)
+        state_matches = ACCUEIL_STATE_RE.findall(plain)
         if state_matches:
             result["general_state"] = state_matches[-1].upper()
 
     if not result.get("next_action"):
-        next_action_match = re.search(
-            r"\b(Aucune|Aucun|Arrêté|Arrete|Arrêt|Arret|Non \(Automne\))\b",
-            plain,
-            re.IGNORECASE,
-        )
+        next_action_match = ACCUEIL_NEXT_ACTION_RE.search(plain)
         if next_action_match:
             result["next_action"] = next_action_match.group(1)
 
-    compact_match = ACCUEIL_COMPACT_RE.search(plain)
+    compact_match = _search_accueil_compact(plain)
     if compact_match:
         compact = compact_match.groupdict()
 
@@ -696,7 +1322,179 @@ def parse_reg(raw: str) -> dict[str, Any]:
     }
 
 
-class OFoehnCoordinator(DataUpdateCoordinator[dict]):
+def parse_section(
+    endpoint: str, raw: str, *, digest: bytes | None = None, keep_raw: bool = False
+) -> EndpointSection:
+    """Parse one poll endpoint payload into its snapshot section."""
+    if digest is None:
+        digest = _payload_digest(raw)
+    kept = raw if keep_raw else None
+    if endpoint == "super":
+        values, donnees, metadata = parse_super_payload(raw)
+        return SuperSection(digest, len(raw), values, metadata, raw=kept, donnees=donnees)
+    metadata = parse_page_metadata(raw)
+    if endpoint == "accueil":
+        return AccueilSection(
+            digest,
+            len(raw),
+            parse_accueil_html(raw),
+            metadata,
+            raw=kept,
+            donnees=parse_donnees(raw),
+        )
+    fields = parse_reg(raw)
+    # The payload and its split lines are not needed once parsed.
+    fields.pop("raw", None)
+    fields.pop("values", None)
+    return RegSection(
+        digest,
+        len(raw),
+        fields,
+        metadata,
+        raw=kept,
+        mentions_auto="AUTO" in clean_html_text(raw).upper(),
+    )
+
+
+# Reg text values that mean "no information" and fall back to accueil.cgi.
+REG_TEXT_EMPTY = (None, "", "Inconnu")
+REG_TEXT_FALLBACKS = {
+    "regulation": ("reg_mode",),
+    "next_action": ("next_action",),
+    "status": ("stopped_state", "general_state"),
+}
+RUNNING_STATES = {"normal", "marche", "en marche", "running"}
+
+
+def get_donnee_float(
+    data: Mapping[str, Any],
+    idx_key: str,
+    *,
+    source: str = "super",
+    fallback_key: str | None = None,
+) -> float | None:
+    """Read a numeric DONNEE index with an optional flat fallback key."""
+    indices = data.get("indices") or {}
+    idx = indices.get(idx_key)
+    if idx is not None:
+        bucket = data.get(source) or {}
+        value = bucket.get(idx)
+        if value is not None:
+            return float(value)
+    if fallback_key:
+        fallback = data.get(fallback_key)
+        if fallback is not None:
+            return float(fallback)
+    return None
+
+
+def get_donnee_bool(
+    data: Mapping[str, Any],
+    idx_key: str,
+    *,
+    source: str = "super",
+    fallback_key: str | None = None,
+    default: bool | None = None,
+) -> bool | None:
+    """Read a boolean DONNEE index with an optional flat fallback key."""
+    indices = data.get("indices") or {}
+    idx = indices.get(idx_key)
+    if idx is not None:
+        bucket = data.get(source) or {}
+        value = bucket.get(idx)
+        if value is not None:
+            try:
+                return float(value) > 0
+            except (TypeError, ValueError):
+                pass
+    if fallback_key is not None:
+        fallback = data.get(fallback_key)
+        if fallback is not None:
+            return bool(fallback)
+    return default
+
+
+def _reg_text(data: PollSnapshot, key: str) -> Any:
+    """Resolve a getReg.cgi text value with its accueil.cgi fallbacks."""
+    value = data.reg.fields.get(key)
+    if key == "mode":
+        fallback_mode = data.get("mode")
+        if fallback_mode and (value is None or (value == "AUTO" and not data.reg.mentions_auto)):
+            return fallback_mode
+        return value or fallback_mode
+
+    if key == "status":
+        stopped_state = data.get("stopped_state")
+        if stopped_state not in REG_TEXT_EMPTY:
+            if clean_html_text(stopped_state).lower() not in RUNNING_STATES:
+                return stopped_state
+
+    if value not in REG_TEXT_EMPTY:
+        return value
+    for fallback_key in REG_TEXT_FALLBACKS.get(key, ()):
+        fallback_value = data.get(fallback_key)
+        if fallback_value not in REG_TEXT_EMPTY:
+            return fallback_value
+    return value
+
+
+def build_entity_view(data: PollSnapshot | None) -> EntityView:
+    """Resolve every entity value of a snapshot once."""
+    if data is None:
+        return EntityView()
+    power_on = bool(get_donnee_bool(data, "power_idx", fallback_key="power_on", default=True))
+
+    target = data.reg.fields.get("setpoint")
+    if target is None:
+        target = data.get("setpoint")
+
+    climate_mode = "OFF"
+    if power_on:
+        mode = data.reg.fields.get("mode")
+        accueil_mode = data.get("mode")
+        if accueil_mode and (mode is None or (mode == "AUTO" and not data.reg.mentions_auto)):
+            mode = accueil_mode
+        climate_mode = mode if mode in ("CHAUD", "FROID", "OFF") else "AUTO"
+
+    setpoint_diff = data.get("delta")
+    if setpoint_diff is None:
+        water_in = data.get("water_in")
+        setpoint = data.get("setpoint")
+        if water_in is not None and setpoint is not None:
+            setpoint_diff = round(setpoint - water_in, 2)
+
+    heating_on = get_donnee_bool(data, "heating_idx")
+    if heating_on is None:
+        heating_on = bool(data.get("compressor_1_on") or data.get("compressor_2_on"))
+
+    return EntityView(
+        super_stale=bool(data.super.stale),
+        restored=data.restored,
+        power_on=power_on,
+        climate_mode=climate_mode,
+        target_temperature=target,
+        water_in=get_donnee_float(data, "water_in_idx", fallback_key="water_in"),
+        water_out=get_donnee_float(data, "water_out_idx", fallback_key="water_out"),
+        air=get_donnee_float(data, "air_idx", fallback_key="air_temp"),
+        internal_temp=get_donnee_float(data, "internal_idx", fallback_key="internal_temp"),
+        voltage=get_donnee_float(data, "voltage_idx", fallback_key="voltage"),
+        setpoint_diff=setpoint_diff,
+        reg_mode=_reg_text(data, "mode"),
+        regulation=_reg_text(data, "regulation"),
+        next_action=_reg_text(data, "next_action"),
+        status=_reg_text(data, "status"),
+        pump_on=bool(get_donnee_bool(data, "pump_idx", fallback_key="pump_on", default=False)),
+        heating_on=heating_on,
+        light_on=data.accueil.donnees.get(data.indices.get("light_idx"), 0) == 1,
+    )
+
+
+def _has_payload(snapshot: PollSnapshot | None, endpoint: str) -> bool:
+    """Whether the snapshot holds a payload of the endpoint to fall back on."""
+    return snapshot is not None and snapshot.section(endpoint).size > 0
+
+
+class OFoehnCoordinator(DataUpdateCoordinator[PollSnapshot]):
     def __init__(
         self,
         hass: HomeAssistant,
@@ -705,19 +1503,297 @@ class OFoehnCoordinator(DataUpdateCoordinator[dict]):
         api: OFoehnApi,
         update_interval: timedelta,
         options: dict[str, Any] | None,
+        poll_slots: asyncio.Semaphore | None = None,
+        store: Store | None = None,
     ) -> None:
-        super().__init__(hass, logger, name=name, update_interval=update_interval)
+        # Listeners are only notified when the returned snapshot differs.
+        # With shared poll slots the domain PollScheduler times the polls
+        # instead of the coordinator's own timer.
+        super().__init__(
+            hass,
+            logger,
+            name=name,
+            update_interval=None if poll_slots is not None else update_interval,
+            always_update=False,
+        )
         self.api = api
         self.options = options or {}
+        self.base_interval = update_interval
+        self.poll_interval = update_interval
+        self.interval_reason = "fixed"
+        self._fast_polls_left = 0
+        self._fast_reason = "write"
+        self.poll_slots = poll_slots
+        self.poll_lag: float | None = None
+        self.max_poll_lag: float = 0.0
+        self.phase_offset: float | None = None
+        self._poll_due: float | None = None
+        # Set by the scheduler; a scheduled poll absorbs pending partial refreshes.
+        self._scheduled_poll = False
+        self._device_data: PollSnapshot | None = None
+        self._expectations: dict[str, tuple[Any, float]] = {}
+        self._partial_endpoints: set[str] = set()
         self._cached_indices: dict[str, int] | None = None
         self._cached_indices_options: dict[str, Any] | None = None
         self._last_poll_error_log: float = 0.0
+        self._tick = 0
+        self._last_poll_state: tuple[Any, ...] | None = None
+        self._sections: dict[str, EndpointSection] = {}
+        self._view: EntityView | None = None
+        self._view_source: PollSnapshot | None = None
+        self._stats_listeners: list[Callable[[], None]] = []
+        self.poll_stats: dict[str, int] = {"polls": 0, "unchanged_polls": 0, "partial_polls": 0}
+        self.telemetry = PollTelemetry(tuple(key for key, _, _ in POLL_ENDPOINTS))
+        self._profile: PollProfile | None = None
+        self._store = store
+        self._save_pending = False
+        # Last payload of each endpoint that parsed without error, persisted.
+        self._payloads: dict[str, str] = {}
+        self._apply_api_options()
+
+    @property
+    def view(self) -> EntityView:
+        """Entity values of the current snapshot, resolved on first use."""
+        data = self.data
+        if self._view is None or self._view_source is not data:
+            self._view = build_entity_view(data)
+            self._view_source = data
+        return self._view
 
     def set_options(self, options: dict[str, Any]) -> None:
         """Apply new config entry options and invalidate cached indices."""
         self.options = options or {}
         self._cached_indices = None
         self._cached_indices_options = None
+        self._last_poll_state = None
+        self._apply_api_options()
+
+    def _apply_api_options(self) -> None:
+        self.api.set_max_in_flight(self.options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT))
+        self.api.set_read_timeouts(
+            {
+                "super": self.options.get(CONF_SUPER_TIMEOUT),
+                "accueil": self.options.get(CONF_ACCUEIL_TIMEOUT),
+                "reg": self.options.get(CONF_REG_TIMEOUT),
+            }
+        )
+        self.api.set_body_limits(
+            self.options.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE),
+            self.options.get(CONF_RESPONSE_ENCODING, RESPONSE_ENCODING_AUTO),
+        )
+
+    @property
+    def poll_deadline(self) -> float:
+        """Seconds a poll cycle may spend reading endpoints."""
+        try:
+            seconds = int(self.options.get(CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE))
+        except (TypeError, ValueError):
+            seconds = DEFAULT_POLL_DEADLINE
+        return max(MIN_POLL_DEADLINE, min(MAX_POLL_DEADLINE, seconds))
+
+    def set_poll_interval(self, interval: timedelta) -> None:
+        """Change the configured poll period; adaptive mode adjusts from there."""
+        self.base_interval = interval
+        self._apply_poll_interval(interval, "fixed")
+
+    def _apply_poll_interval(self, interval: timedelta, reason: str) -> None:
+        self.poll_interval = interval
+        self.interval_reason = reason
+        if self.poll_slots is None:
+            self.update_interval = interval
+
+    def _adapt_poll_interval(self, previous: dict[str, Any], data: dict[str, Any]) -> None:
+        """Pick the next poll period from the pump state.
+
+        Reasons: ``write`` and ``state_change`` poll at MIN_SCAN_INTERVAL for a
+        few polls, ``converging`` halves the configured interval while the
+        water nears the setpoint, ``off``/``idle`` double it up to
+        MAX_SCAN_INTERVAL, ``normal`` keeps it and ``fixed`` means adaptive
+        mode is disabled.
+        """
+        if not self.options.get(CONF_ADAPTIVE_INTERVAL, False):
+            if self.poll_interval != self.base_interval or self.interval_reason != "fixed":
+                self._apply_poll_interval(self.base_interval, "fixed")
+            return
+
+        base = self.base_interval.total_seconds()
+        if previous and any(previous.get(key) != data.get(key) for key in ADAPTIVE_STATE_KEYS):
+            self._fast_polls_left = ADAPTIVE_FAST_POLLS
+            self._fast_reason = "state_change"
+
+        if self._fast_polls_left > 0:
+            self._fast_polls_left -= 1
+            seconds, reason = MIN_SCAN_INTERVAL, self._fast_reason
+        elif data.get("power_on") is False or (
+            data.get("pump_on") is False and not data.get("compressor_1_on")
+        ):
+            # Back off while nothing is running, from the configured interval.
+            current = self.poll_interval.total_seconds()
+            seconds = base if current < base else min(MAX_SCAN_INTERVAL, current * 2)
+            reason = "off" if data.get("power_on") is False else "idle"
+        else:
+            water_in = data.get("water_in")
+            setpoint = data.get("setpoint")
+            if setpoint is None:
+                setpoint = (data.get("reg") or {}).get("setpoint")
+            if (
+                data.get("compressor_1_on")
+                and water_in is not None
+                and setpoint is not None
+                and abs(setpoint - water_in) <= ADAPTIVE_CONVERGING_BAND
+            ):
+                seconds, reason = max(MIN_SCAN_INTERVAL, base / 2), "converging"
+            else:
+                seconds, reason = base, "normal"
+
+        interval = timedelta(seconds=seconds)
+        if interval != self.poll_interval or reason != self.interval_reason:
+            self._apply_poll_interval(interval, reason)
+
+    def mark_poll_due(self, due: float) -> None:
+        """Record the loop time a scheduled poll was due, to measure its lag."""
+        self._poll_due = due
+        self._scheduled_poll = True
+
+    async def async_write(
+        self,
+        command: Awaitable[Any],
+        endpoints: tuple[str, ...] = (),
+        **expected: Any,
+    ) -> None:
+        """Run a device command and show its expected result right away.
+
+        ``expected`` takes ``setpoint``, ``mode``, ``power`` and ``light``. The
+        values overlay the snapshot until a poll reports them, and are dropped
+        if the command fails or the device disagrees for longer than
+        OPTIMISTIC_CONFIRM_WINDOW. ``endpoints`` limits the confirmation
+        refresh to the poll endpoints the command affects.
+        """
+        if self._device_data is not None:
+            deadline = time.monotonic() + OPTIMISTIC_CONFIRM_WINDOW
+            for kind, value in expected.items():
+                self._expectations[kind] = (value, deadline)
+            self.async_set_updated_data(self._apply_expectations(self._device_data))
+        try:
+            sent = await command
+        except Exception:
+            for kind in expected:
+                self._expectations.pop(kind, None)
+            if self._device_data is not None:
+                self.async_set_updated_data(self._apply_expectations(self._device_data))
+            raise
+        if sent is not False:
+            # Writes merged into a later setReg.cgi POST leave the confirmation
+            # refresh to that call.
+            if endpoints:
+                await self.async_request_partial_refresh(*endpoints)
+            else:
+                await self.async_request_refresh()
+
+    async def async_request_partial_refresh(self, *endpoints: str) -> None:
+        """Request a refresh that only re-reads the given poll endpoints.
+
+        Endpoint keys are those of POLL_ENDPOINTS (``super``, ``accueil``,
+        ``reg``); the rest of the snapshot is carried over. A scheduled poll
+        that runs first reads them along with its own endpoints and cancels
+        the request.
+        """
+        self._partial_endpoints.update(endpoints)
+        await self.async_request_refresh()
+
+    @staticmethod
+    def _observed(data: PollSnapshot, kind: str) -> Any:
+        reg = data.get("reg") or {}
+        indices = data.get("indices") or {}
+        if kind == "setpoint":
+            value = reg.get("setpoint")
+            return value if value is not None else data.get("setpoint")
+        if kind == "mode":
+            return reg.get("mode") or data.get("mode")
+        if kind == "power":
+            value = (data.get("super") or {}).get(indices.get("power_idx"))
+            if value is not None:
+                return value > 0
+            power_on = data.get("power_on")
+            return None if power_on is None else bool(power_on)
+        value = (data.get("accueil") or {}).get(indices.get("light_idx"))
+        return value == 1
+
+    @staticmethod
+    def _overlay(data: PollSnapshot, kind: str, value: Any) -> PollSnapshot:
+        if kind in ("setpoint", "mode"):
+            reg = replace(data.reg, fields={**data.reg.fields, kind: value})
+            return replace(data, reg=reg, overrides={**data.overrides, kind: value})
+        if kind == "power":
+            idx = data.indices.get("power_idx")
+            sup = data.super
+            if idx is not None:
+                sup = replace(sup, donnees={**sup.donnees, idx: 1.0 if value else 0.0})
+            return replace(data, super=sup, overrides={**data.overrides, "power_on": value})
+        idx = data.indices.get("light_idx")
+        if idx is None:
+            return data
+        accueil = replace(data.accueil, donnees={**data.accueil.donnees, idx: 1.0 if value else 0.0})
+        return replace(data, accueil=accueil)
+
+    def _apply_expectations(self, data: PollSnapshot) -> PollSnapshot:
+        """Overlay pending optimistic values, confirming or expiring them."""
+        if not self._expectations:
+            return data
+        now = time.monotonic()
+        result = data
+        for kind, (value, deadline) in list(self._expectations.items()):
+            observed = self._observed(data, kind)
+            if observed == value or (
+                kind == "setpoint" and observed is not None and abs(observed - value) < 0.05
+            ):
+                del self._expectations[kind]
+                continue
+            if now >= deadline:
+                self.logger.debug(
+                    "Device reports %s=%s instead of %s, rolling back", kind, observed, value
+                )
+                del self._expectations[kind]
+                continue
+            result = self._overlay(result, kind, value)
+        return result
+
+    def async_add_stats_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call back after every poll, even when the snapshot did not change."""
+        self._stats_listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            if update_callback in self._stats_listeners:
+                self._stats_listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_stats_listeners(self) -> None:
+        for update_callback in list(self._stats_listeners):
+            update_callback()
+
+    def _section(
+        self, key: str, raw: str, digest: bytes, stale: bool, error: str | None
+    ) -> EndpointSection:
+        """Parse an endpoint payload, reusing the last section when it did not change."""
+        section = self._sections.get(key)
+        if section is None or section.digest != digest:
+            started = time.perf_counter()
+            section = self._sections[key] = parse_section(
+                key,
+                raw,
+                digest=digest,
+                keep_raw=bool(self.options.get(CONF_ENABLE_RAW_SENSORS, False)),
+            )
+            elapsed = time.perf_counter() - started
+            self.telemetry.endpoints[key].record_parse(elapsed)
+            if raw and not stale:
+                self._payloads[key] = raw
+            if self._profile is not None:
+                self._profile.add(f"parse.{key}", elapsed)
+        if stale or error is not None:
+            return replace(section, stale=stale, error=error)
+        return section
 
     def _build_indices(self) -> dict[str, int]:
         if self._cached_indices is not None and self._cached_indices_options == self.options:
@@ -742,27 +1818,70 @@ class OFoehnCoordinator(DataUpdateCoordinator[dict]):
         *,
         name: str,
         reader,
-        previous_raw: str | None,
+        cached: bool,
         required: bool = False,
-    ) -> tuple[str, bool, str | None]:
+        deadline: float | None = None,
+    ) -> tuple[str | None, bool, str | None]:
+        """Read an endpoint; a None payload means "reuse the cached section"."""
         try:
-            return await reader(), False, None
+            if deadline is None:
+                return await reader(), False, None
+            if deadline <= self.hass.loop.time():
+                raise TimeoutError
+            async with asyncio.timeout_at(deadline):
+                return await reader(), False, None
         except Exception as err:
-            if previous_raw:
+            error = self.api.describe_error(err)
+            if (
+                isinstance(err, TimeoutError)
+                and deadline is not None
+                and deadline <= self.hass.loop.time()
+            ):
+                error = "poll deadline exceeded"
+            if cached:
                 self.logger.debug(
                     "Read %s failed, reusing cached payload: %s",
                     name,
-                    err,
+                    error,
                 )
-                return previous_raw, True, str(err)
+                return None, True, error
             if required:
-                raise UpdateFailed(f"Unable to refresh {name}: {err}") from err
+                raise UpdateFailed(f"Unable to refresh {name}: {error}") from err
             self.logger.debug(
                 "Read %s failed with no cached payload available: %s",
                 name,
-                err,
+                error,
             )
-            return "", True, str(err)
+            return "", True, error
+
+    def _due_endpoints(self, previous: PollSnapshot | None) -> set[str]:
+        """Pick the endpoints to fetch this tick.
+
+        super.cgi is read on every tick. accueil.cgi and getReg.cgi follow their
+        own tick periods, and are read early after a write touched them or when
+        the last read failed or never happened.
+        """
+        dirty = self.api.pop_dirty_endpoints()
+        if dirty:
+            self._fast_polls_left = ADAPTIVE_FAST_POLLS
+            self._fast_reason = "write"
+        due = {"super"} | dirty
+        for key, option, default in (
+            ("accueil", CONF_ACCUEIL_REFRESH_TICKS, DEFAULT_ACCUEIL_REFRESH_TICKS),
+            ("reg", CONF_REG_REFRESH_TICKS, DEFAULT_REG_REFRESH_TICKS),
+        ):
+            try:
+                period = int(self.options.get(option, default))
+            except (TypeError, ValueError):
+                period = default
+            period = max(1, min(MAX_REFRESH_TICKS, period))
+            if (
+                self._tick % period == 0
+                or not _has_payload(previous, key)
+                or previous.section(key).stale
+            ):
+                due.add(key)
+        return due
 
     def _log_poll_errors(self, errors: dict[str, str | None]) -> None:
         """Emit at most one throttled warning per persistent poll outage."""
@@ -786,73 +1905,314 @@ class OFoehnCoordinator(DataUpdateCoordinator[dict]):
     async def _read_endpoint(
         self,
         *,
+        key: str,
         name: str,
         reader: Callable[[], Any],
-        previous_raw: str | None,
+        cached: bool,
         required: bool = False,
-    ) -> tuple[str, bool, str | None]:
-        return await self._read_with_fallback(
-            name=name,
-            reader=reader,
-            previous_raw=previous_raw,
-            required=required,
-        )
+        deadline: float | None = None,
+    ) -> tuple[str | None, bool, str | None]:
+        telemetry = self.telemetry.endpoints[key]
+        started = time.perf_counter()
+        try:
+            result = await self._read_with_fallback(
+                name=name,
+                reader=reader,
+                cached=cached,
+                required=required,
+                deadline=deadline,
+            )
+        except UpdateFailed as err:
+            telemetry.record_read(
+                time.perf_counter() - started, None, True, self.api.describe_error(err)
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        telemetry.record_read(elapsed, *result)
+        if self._profile is not None:
+            # _read_body already timed the decode of a fresh payload.
+            decode = self.api.body_stats[name]["decode_ms"] / 1000 if result[0] else 0.0
+            self._profile.add(f"fetch.{key}", elapsed - decode)
+            self._profile.add(f"decode.{key}", decode)
+        return result
 
-    async def _async_update_data(self) -> dict:
-        previous = self.data if isinstance(self.data, dict) else {}
+    async def _read_due(
+        self, previous: PollSnapshot | None, due: set[str]
+    ) -> dict[str, tuple[str | None, bool, str | None]]:
+        reads: dict[str, tuple[str | None, bool, str | None]] = {}
+        # Every read of this cycle, login included, shares one time budget.
+        deadline = self.hass.loop.time() + self.poll_deadline
+
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self.api.prepare_for_reads()
+        except TimeoutError as err:
+            raise UpdateFailed("Login did not complete within the poll deadline") from err
+
+        plan = [
+            (key, name, getattr(self.api, reader))
+            for key, name, reader in POLL_ENDPOINTS
+            if key in due
+        ]
+        if self.api.max_in_flight > 1:
+            tasks = [
+                asyncio.create_task(
+                    self._read_endpoint(
+                        key=key,
+                        name=name,
+                        reader=reader,
+                        cached=_has_payload(previous, key),
+                        required=key == "super",
+                        deadline=deadline,
+                    )
+                )
+                for key, name, reader in plan
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # super.cgi failed (or the poll was cancelled): stop the other reads.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            reads.update(zip((key for key, _, _ in plan), results))
+        else:
+            for position, (key, name, reader) in enumerate(plan):
+                if position:
+                    await asyncio.sleep(INTER_REQUEST_DELAY)
+                    if self._profile is not None:
+                        self._profile.add("delay", INTER_REQUEST_DELAY)
+                reads[key] = await self._read_endpoint(
+                    key=key,
+                    name=name,
+                    reader=reader,
+                    cached=_has_payload(previous, key),
+                    required=key == "super",
+                    deadline=deadline,
+                )
+                if key == "super" and reads[key][2] is not None:
+                    # The device did not answer: do not pay the timeout twice more.
+                    for skipped, _, _ in plan[position + 1 :]:
+                        reads[skipped] = (
+                            None if _has_payload(previous, skipped) else "",
+                            True,
+                            "skipped, super.cgi unreachable",
+                        )
+                        self.telemetry.endpoints[skipped].record_skipped(reads[skipped][2])
+                    break
+        return reads
+
+    def _record_breaker_failure(self) -> None:
+        breaker = self.api.breaker
+        if breaker.record_failure():
+            self.logger.warning(
+                "PAC unreachable after %s failed polls — pausing full polls until a probe succeeds",
+                breaker.failures,
+            )
 
-        await self.api.prepare_for_reads()
+    async def _async_probe_breaker(self, previous: PollSnapshot | None) -> PollSnapshot | None:
+        """Handle a poll while the breaker is open.
+
+        Returns the snapshot to publish when the poll is short-circuited, or
+        None when a probe succeeded and the full poll should go ahead.
+        """
+        breaker = self.api.breaker
+        error = f"circuit breaker open after {breaker.failures} failures"
+        if breaker.probe_due():
+            breaker.begin_probe()
+            try:
+                await self.api.probe()
+            except Exception as err:
+                breaker.record_failure()
+                error = f"{error}: {self.api.describe_error(err)}"
+                self.logger.debug("Half-open probe failed: %s", error)
+            else:
+                return None
+        breaker.short_circuited += 1
+        # Rebuild the snapshot from scratch once the device answers again.
+        self._last_poll_state = None
+        if previous is None:
+            raise UpdateFailed(f"PAC unreachable ({error})")
+        return previous.mark_stale(error)
+
+    async def _async_update_data(self) -> PollSnapshot:
+        if self.poll_slots is None:
+            data = await self._async_timed_poll()
+        else:
+            async with self.poll_slots:
+                if self._poll_due is not None:
+                    self.poll_lag = max(0.0, self.hass.loop.time() - self._poll_due)
+                    self.max_poll_lag = max(self.max_poll_lag, self.poll_lag)
+                    self._poll_due = None
+                data = await self._async_timed_poll()
+        self._device_data = data
+        started = time.perf_counter()
+        data = self._apply_expectations(data)
+        if self._profile is not None:
+            self._profile.add("snapshot", time.perf_counter() - started)
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        if self._profile is None:
+            super().async_update_listeners()
+            return
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self._profile.add("fanout", time.perf_counter() - started)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the persisted payloads as a stale snapshot until the first poll.
+
+        Returns False when nothing usable was stored.
+        """
+        if self._store is None:
+            return False
+        stored = await self._store.async_load()
+        payloads = (stored or {}).get("payloads") or {}
+        if not payloads.get("super"):
+            return False
+        keep_raw = bool(self.options.get(CONF_ENABLE_RAW_SENSORS, False))
+        sections = {}
+        for key, _, _ in POLL_ENDPOINTS:
+            raw = payloads.get(key) or ""
+            section = sections[key] = parse_section(key, raw, keep_raw=keep_raw)
+            if raw:
+                self._sections[key] = section
+                self._payloads[key] = raw
+        error = f"restored from storage, saved {stored.get('saved_at')}"
+        data = PollSnapshot(
+            super=sections["super"],
+            accueil=sections["accueil"],
+            reg=sections["reg"],
+            indices=self._build_indices(),
+            restored=True,
+        ).mark_stale(error)
+        self.data = self._device_data = data
+        return True
+
+    def _stored_snapshot(self) -> dict[str, Any]:
+        # Called by the Store when it writes, with the payloads of that moment.
+        self._save_pending = False
+        return {"saved_at": datetime.now(timezone.utc).isoformat(), "payloads": dict(self._payloads)}
+
+    async def async_profile(self, cycles: int, use_cprofile: bool = False) -> PollProfile:
+        """Run ``cycles`` polls right away, timing each stage of the pipeline."""
+        if self._profile is not None:
+            raise HomeAssistantError("A profile is already running for this device")
+        profile = self._profile = PollProfile(cycles, use_cprofile)
+        try:
+            for _ in range(cycles):
+                profile.begin_cycle()
+                await self.async_refresh()
+                profile.end_cycle(
+                    None if self.last_update_success else str(self.last_exception)
+                )
+        finally:
+            self._profile = None
+        return profile
+
+    async def _async_timed_poll(self) -> PollSnapshot:
+        started = time.perf_counter()
+        data = None
+        try:
+            data = await self._async_poll()
+            return data
+        finally:
+            self.telemetry.record_poll(time.perf_counter() - started, data)
+            self._notify_stats_listeners()
+
+    async def _async_poll(self) -> PollSnapshot:
+        previous = self._device_data
+        partial = self._partial_endpoints
+        scheduled, self._scheduled_poll = self._scheduled_poll, False
+        targeted = bool(partial and previous and not scheduled)
+
+        breaker = self.api.breaker
+        if breaker.state != BREAKER_CLOSED and (not targeted or "super" in partial):
+            # Decided before the write marks and the tick are consumed, so a
+            # short-circuited poll leaves them for the next real one.
+            short_circuited = await self._async_probe_breaker(previous)
+            if short_circuited is not None:
+                return short_circuited
+
+        self._partial_endpoints = set()
+        if targeted:
+            # Targeted refresh after a write: keep the tick schedule and any
+            # other pending write marks for the next regular poll.
+            due = partial
+            self.api.discard_dirty(partial)
+            self._fast_polls_left = ADAPTIVE_FAST_POLLS
+            self._fast_reason = "write"
+            self.poll_stats["partial_polls"] += 1
+        else:
+            if partial:
+                # This full poll re-reads the requested endpoints too.
+                self._debounced_refresh.async_cancel()
+            due = self._due_endpoints(previous) | partial
+            self._tick += 1
+        if "super" in due:
+            try:
+                reads = await self._read_due(previous, due)
+            except Exception:
+                self._record_breaker_failure()
+                raise
+            if reads["super"][2] is None:
+                if breaker.record_success():
+                    self.logger.info("PAC reachable again, resuming regular polling")
+            else:
+                self._record_breaker_failure()
+        else:
+            reads = await self._read_due(previous, due)
 
-        sup, sup_stale, sup_error = await self._read_endpoint(
-            name="super.cgi",
-            reader=self.api.read_super,
-            previous_raw=previous.get("super_raw"),
-            required=True,
-        )
-        await asyncio.sleep(INTER_REQUEST_DELAY)
-        acc, acc_stale, acc_error = await self._read_endpoint(
-            name="accueil.cgi",
-            reader=self.api.read_accueil,
-            previous_raw=previous.get("accueil_raw"),
-        )
-        await asyncio.sleep(INTER_REQUEST_DELAY)
-        reg, reg_stale, reg_error = await self._read_endpoint(
-            name="getReg.cgi",
-            reader=self.api.read_reg,
-            previous_raw=previous.get("reg_raw"),
-        )
         if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug("super_raw: %s", sup)
-            self.logger.debug("accueil_raw: %s", acc)
-            self.logger.debug("reg_raw: %s", reg)
+            for key, (raw, _, _) in reads.items():
+                if raw is not None:
+                    self.logger.debug("%s_raw: %s", key, raw)
         self._log_poll_errors(
             {
-                "super.cgi": sup_error,
-                "accueil.cgi": acc_error,
-                "getReg.cgi": reg_error,
+                name: reads[key][2] if key in reads else None
+                for key, name, _ in POLL_ENDPOINTS
             }
         )
-        page_metadata: dict[str, Any] = {}
-        for raw in (sup, acc, reg):
-            if not page_metadata:
-                page_metadata = parse_page_metadata(raw)
-        parsed_super = parse_super_values(sup)
-        parsed_accueil = parse_accueil_html(acc)
-        return {
-            "super_raw": sup,
-            "accueil_raw": acc,
-            "reg_raw": reg,
-            "super": parse_donnees(sup),
-            "accueil": parse_donnees(acc),
-            "reg": parse_reg(reg),
-            "super_stale": sup_stale,
-            "accueil_stale": acc_stale,
-            "reg_stale": reg_stale,
-            "super_error": sup_error,
-            "accueil_error": acc_error,
-            "reg_error": reg_error,
-            **page_metadata,
-            **parsed_super,
-            **parsed_accueil,
-            "indices": self._build_indices(),
-        }
+
+        sections: dict[str, EndpointSection] = {}
+        for key, _, _ in POLL_ENDPOINTS:
+            raw, stale, error = reads.get(key, (None, False, None))
+            if raw is not None:
+                sections[key] = self._section(key, raw, _payload_digest(raw), stale, error)
+            elif stale or error is not None:
+                sections[key] = replace(previous.section(key), stale=stale, error=error)
+            else:
+                # Not due this tick: carry the last section over unchanged.
+                sections[key] = previous.section(key)
+
+        poll_state = tuple(
+            (section.digest, section.stale, section.error) for section in sections.values()
+        )
+        self.poll_stats["polls"] += 1
+        if previous is not None and poll_state == self._last_poll_state:
+            # Nothing changed on the pump: hand back the same snapshot so the
+            # coordinator skips the listener fan-out.
+            self.poll_stats["unchanged_polls"] += 1
+            self._adapt_poll_interval(previous, previous)
+            return previous
+        self._last_poll_state = poll_state
+
+        started = time.perf_counter()
+        data = PollSnapshot(
+            super=sections["super"],
+            accueil=sections["accueil"],
+            reg=sections["reg"],
+            indices=self._build_indices(),
+        )
+        if self._profile is not None:
+            self._profile.add("snapshot", time.perf_counter() - started)
+        self._adapt_poll_interval(previous, data)
+        if self._store is not None and not data.super.stale and not self._save_pending:
+            # async_delay_save restarts its timer on every call: schedule once
+            # so a pump that changes at every poll is still saved on time.
+            self._save_pending = True
+            self._store.async_delay_save(self._stored_snapshot, SNAPSHOT_SAVE_DELAY)
+        return data
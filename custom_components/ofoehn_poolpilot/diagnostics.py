@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import OFoehnCoordinator
+
+TO_REDACT = {"username", "password", "mac_address", "serial_number"}
+MAC_RE = re.compile(r"\b[0-9A-Fa-f]{2}(?:[:-][0-9A-Fa-f]{2}){5}\b")
+
+
+def _redact_payload(raw: str | None, secrets: set[str]) -> str | None:
+    """Blank the credentials, serial number and MAC addresses of a page or error."""
+    if not raw:
+        return raw
+    for secret in secrets:
+        raw = raw.replace(secret, REDACTED)
+    return MAC_RE.sub(REDACTED, raw)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Entry settings, poll statistics and the last payloads of each endpoint.
+
+    Everything comes from what the coordinator already keeps in memory; the
+    pump is not queried.
+    """
+    coordinator: OFoehnCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    api = coordinator.api
+    snapshot = coordinator.data
+    poll_stats = coordinator.poll_stats
+
+    secrets = {
+        str(value)
+        for value in (
+            *(entry.data.get(key) for key in TO_REDACT),
+            *((snapshot.get(key) for key in TO_REDACT) if snapshot is not None else ()),
+        )
+        # Short values (e.g. a 4-digit password) would blank unrelated data.
+        if value and len(str(value)) >= 6
+    }
+
+    endpoints: dict[str, Any] = {}
+    for endpoint, telemetry in coordinator.telemetry.endpoints.items():
+        stats = telemetry.as_dict()
+        stats["last_error"] = _redact_payload(stats["last_error"], secrets)
+        if snapshot is not None:
+            section = snapshot.section(endpoint)
+            stats["current"] = {
+                "size": section.size,
+                "stale": section.stale,
+                "error": _redact_payload(section.error, secrets),
+            }
+        stats["payloads"] = [
+            {
+                "received": datetime.fromtimestamp(received, timezone.utc).isoformat(),
+                "raw": _redact_payload(raw, secrets),
+            }
+            for received, raw in telemetry.payloads
+        ]
+        endpoints[endpoint] = stats
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "polling": {
+            "scan_interval": coordinator.poll_interval.total_seconds(),
+            "base_interval": coordinator.base_interval.total_seconds(),
+            "interval_reason": coordinator.interval_reason,
+            "poll_deadline": coordinator.poll_deadline,
+            "last_update_success": coordinator.last_update_success,
+            "poll_lag": coordinator.poll_lag,
+            "max_poll_lag": coordinator.max_poll_lag,
+            **poll_stats,
+            "skip_rate": round(poll_stats["unchanged_polls"] / poll_stats["polls"], 3)
+            if poll_stats["polls"]
+            else None,
+        },
+        "breaker": api.breaker.as_dict(),
+        "poll_duration": coordinator.telemetry.as_dict()["poll_duration"],
+        "endpoints": endpoints,
+        "bodies": api.body_stats,
+        "connections": api.connection_stats,
+    }
@@ -38,54 +38,6 @@ def build_device_info(device_key: str, host: str, data: dict[str, Any]) -> dict[
     return info
 
 
-def get_donnee_float(
-    data: dict[str, Any],
-    idx_key: str,
-    *,
-    source: str = "super",
-    fallback_key: str | None = None,
-) -> float | None:
-    """Read a numeric DONNEE index with an optional flat fallback key."""
-    indices = data.get("indices") or {}
-    idx = indices.get(idx_key)
-    if idx is not None:
-        bucket = data.get(source) or {}
-        value = bucket.get(idx)
-        if value is not None:
-            return float(value)
-    if fallback_key:
-        fallback = data.get(fallback_key)
-        if fallback is not None:
-            return float(fallback)
-    return None
-
-
-def get_donnee_bool(
-    data: dict[str, Any],
-    idx_key: str,
-    *,
-    source: str = "super",
-    fallback_key: str | None = None,
-    default: bool | None = None,
-) -> bool | None:
-    """Read a boolean DONNEE index with an optional flat fallback key."""
-    indices = data.get("indices") or {}
-    idx = indices.get(idx_key)
-    if idx is not None:
-        bucket = data.get(source) or {}
-        value = bucket.get(idx)
-        if value is not None:
-            try:
-                return float(value) > 0
-            except (TypeError, ValueError):
-                pass
-    if fallback_key is not None:
-        fallback = data.get(fallback_key)
-        if fallback is not None:
-            return bool(fallback)
-    return default
-
-
 class OFoehnEntity(CoordinatorEntity):
     """Shared base for PoolPilot entities."""
 
@@ -105,5 +57,7 @@ class OFoehnEntity(CoordinatorEntity):
 
     @property
     def available(self) -> bool:
-        data = self.coordinator.data or {}
-        return self.coordinator.last_update_success and not data.get("super_stale", False)
+        # A snapshot restored at startup is stale by definition but still the
+        # best known state until the first poll answers.
+        view = self.coordinator.view
+        return self.coordinator.last_update_success and (not view.super_stale or view.restored)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+
+# Functions listed in the service response when cProfile is enabled.
+PROFILE_TOP_FUNCTIONS = 15
+
+
+class PollProfile:
+    """Per-stage timings of a few poll cycles, with an optional cProfile.
+
+    Stages are named ``fetch.<endpoint>`` (network, login and body read),
+    ``decode.<endpoint>``, ``parse.<endpoint>``, ``delay`` (pause between
+    sequential reads), ``snapshot`` (snapshot, indices and optimistic
+    overlay) and ``fanout`` (coordinator listeners: entity view and state
+    writes). Parallel reads overlap, so their stages may add up to more than
+    the cycle. cProfile sees the whole event loop thread while a cycle runs,
+    so other integrations may show up in it.
+    """
+
+    def __init__(self, cycles: int, use_cprofile: bool = False) -> None:
+        self.cycles = cycles
+        self.records: list[dict[str, Any]] = []
+        self.profiler = cProfile.Profile() if use_cprofile else None
+        self._current: dict[str, float] | None = None
+        self._started = 0.0
+
+    def begin_cycle(self) -> None:
+        self._current = {}
+        self._started = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def add(self, stage: str, seconds: float) -> None:
+        if self._current is not None:
+            self._current[stage] = self._current.get(stage, 0.0) + seconds
+
+    def end_cycle(self, error: str | None = None) -> None:
+        if self._current is None:
+            return
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.records.append(
+            {
+                "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+                "error": error,
+                "stages_ms": {
+                    stage: round(seconds * 1000, 3) for stage, seconds in self._current.items()
+                },
+            }
+        )
+        self._current = None
+
+    def summary(self) -> dict[str, Any]:
+        stages: dict[str, list[float]] = {}
+        for record in self.records:
+            for stage, elapsed in record["stages_ms"].items():
+                stages.setdefault(stage, []).append(elapsed)
+        totals = [record["total_ms"] for record in self.records]
+        summary: dict[str, Any] = {
+            "cycles": len(self.records),
+            "errors": sum(1 for record in self.records if record["error"]),
+            "total_ms": _spread(totals),
+            "stages_ms": {stage: _spread(values) for stage, values in sorted(stages.items())},
+        }
+        if self.profiler is not None:
+            summary["top_functions"] = self._top_functions(PROFILE_TOP_FUNCTIONS)
+        return summary
+
+    def _top_functions(self, limit: int) -> list[dict[str, Any]]:
+        stats = pstats.Stats(self.profiler)
+        # By own time, leaving out the event loop idling in select/epoll.
+        rows = sorted(
+            (
+                item
+                for item in stats.stats.items()
+                if not (item[0][0] == "~" and "select" in item[0][2])
+            ),
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        return [
+            {
+                "function": f"{Path(filename).name}:{line}({name})",
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+            for (filename, line, name), (_, calls, total, cumulative, _) in rows[:limit]
+        ]
+
+    def write(self, path: Path) -> list[str]:
+        """Write the cycles as JSON and, with cProfile, the .prof and text report.
+
+        Blocking; run it in the executor. Returns the written file paths.
+        """
+        path.write_text(
+            json.dumps({"summary": self.summary(), "cycles": self.records}, indent=2),
+            encoding="utf-8",
+        )
+        written = [str(path)]
+        if self.profiler is not None:
+            prof_path = path.with_suffix(".prof")
+            self.profiler.dump_stats(prof_path)
+            report = io.StringIO()
+            pstats.Stats(self.profiler, stream=report).sort_stats("cumulative").print_stats(60)
+            text_path = path.with_suffix(".txt")
+            text_path.write_text(report.getvalue(), encoding="utf-8")
+            written += [str(prof_path), str(text_path)]
+        return written
+
+
+def _spread(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"mean": None, "max": None}
+    return {"mean": round(sum(values) / len(values), 3), "max": round(max(values), 3)}
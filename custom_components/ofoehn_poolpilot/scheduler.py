@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DOMAIN, MAX_CONCURRENT_DEVICE_POLLS
+from .coordinator import OFoehnCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Time the polls of every config entry of the domain.
+
+    Entries registered in ``hass.data[DOMAIN]`` are ordered by entry id and
+    phase-shifted evenly across their poll interval, so several pumps never
+    poll at the same moment. Each entry fires on a fixed grid anchored at the
+    scheduler start, which keeps the phases from drifting with poll duration.
+    The shared ``slots`` semaphore caps how many devices are polled at once.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = MAX_CONCURRENT_DEVICE_POLLS) -> None:
+        self.hass = hass
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self._epoch = hass.loop.time()
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._stats_unsubs: dict[str, tuple[OFoehnCoordinator, Callable[[], None]]] = {}
+
+    def _coordinators(self) -> list[tuple[str, OFoehnCoordinator]]:
+        entries = self.hass.data.get(DOMAIN, {})
+        return [(entry_id, entries[entry_id]["coordinator"]) for entry_id in sorted(entries)]
+
+    def _next_due(self, coordinator: OFoehnCoordinator, position: int, count: int) -> float:
+        interval = coordinator.poll_interval.total_seconds()
+        offset = interval * position / count
+        coordinator.phase_offset = round(offset, 3)
+        anchor = self._epoch + offset
+        periods = math.floor((self.hass.loop.time() - anchor) / interval) + 1
+        return anchor + max(periods, 0) * interval
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Recompute the phase of every entry, e.g. after an entry or interval change."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        coordinators = self._coordinators()
+        self._track_intervals(coordinators)
+        for position, (entry_id, coordinator) in enumerate(coordinators):
+            self._schedule(entry_id, coordinator, position, len(coordinators))
+
+    def _track_intervals(self, coordinators: list[tuple[str, OFoehnCoordinator]]) -> None:
+        """Follow every coordinator's polls to catch adaptive interval changes."""
+        current = dict(coordinators)
+        for entry_id, (coordinator, unsub) in list(self._stats_unsubs.items()):
+            if current.get(entry_id) is not coordinator:
+                unsub()
+                del self._stats_unsubs[entry_id]
+        for entry_id, coordinator in coordinators:
+            if entry_id not in self._stats_unsubs:
+                unsub = coordinator.async_add_stats_listener(
+                    lambda entry_id=entry_id: self._async_interval_changed(entry_id)
+                )
+                self._stats_unsubs[entry_id] = (coordinator, unsub)
+
+    @callback
+    def _async_interval_changed(self, entry_id: str) -> None:
+        """Pull a pending poll forward when an out-of-band poll shortened the interval."""
+        timer = self._timers.get(entry_id)
+        if timer is None:
+            # Scheduled poll in progress; it reschedules itself when done.
+            return
+        coordinator = self._stats_unsubs[entry_id][0]
+        if timer.when() <= self.hass.loop.time() + coordinator.poll_interval.total_seconds():
+            return
+        timer.cancel()
+        del self._timers[entry_id]
+        ids = [candidate for candidate, _ in self._coordinators()]
+        if entry_id in ids:
+            self._schedule(entry_id, coordinator, ids.index(entry_id), len(ids))
+
+    def _schedule(self, entry_id: str, coordinator: OFoehnCoordinator, position: int, count: int) -> None:
+        due = self._next_due(coordinator, position, count)
+        self._timers[entry_id] = self.hass.loop.call_at(due, self._fire, entry_id, due)
+
+    @callback
+    def _fire(self, entry_id: str, due: float) -> None:
+        self._timers.pop(entry_id, None)
+        if self.hass.is_stopping:
+            return
+        self.hass.async_create_background_task(
+            self._async_poll(entry_id, due), name=f"{DOMAIN} poll {entry_id}"
+        )
+
+    async def _async_poll(self, entry_id: str, due: float) -> None:
+        info = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        if info is None:
+            return
+        coordinator: OFoehnCoordinator = info["coordinator"]
+        coordinator.mark_poll_due(due)
+        try:
+            await coordinator.async_refresh()
+        finally:
+            # The entry may have been unloaded or rescheduled while polling.
+            ids = [candidate for candidate, _ in self._coordinators()]
+            if entry_id in ids and entry_id not in self._timers:
+                coordinator = self.hass.data[DOMAIN][entry_id]["coordinator"]
+                self._schedule(entry_id, coordinator, ids.index(entry_id), len(ids))
+
+    @callback
+    def async_stop(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for _, unsub in self._stats_unsubs.values():
+            unsub()
+        self._stats_unsubs.clear()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the domain scheduler, creating it on first use."""
+    scheduler = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler(hass)
+    return scheduler
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
-from homeassistant.const import UnitOfElectricPotential, UnitOfPressure, UnitOfTemperature
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfInformation,
+    UnitOfPressure,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import CONF_ENABLE_RAW_SENSORS, DOMAIN
-from .coordinator import OFoehnCoordinator, clean_html_lines, clean_html_text
-from .helpers import OFoehnEntity, get_donnee_float
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CONF_ENABLE_RAW_SENSORS,
+    DOMAIN,
+    RAW_ATTRIBUTE_MAX_CHARS,
+    RAW_ATTRIBUTE_MAX_LINES,
+)
+from .coordinator import POLL_ENDPOINTS, OFoehnCoordinator, clean_html_lines, clean_html_text
+from .helpers import OFoehnEntity
+
+# EntityView attribute of each DONNEE-backed and getReg text sensor.
+VIEW_ATTRIBUTES = {
+    "water_in_idx": "water_in",
+    "water_out_idx": "water_out",
+    "air_idx": "air",
+    "internal_idx": "internal_temp",
+    "voltage_idx": "voltage",
+    "mode": "reg_mode",
+    "regulation": "regulation",
+    "next_action": "next_action",
+    "status": "status",
+}
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -80,6 +108,20 @@ async def async_setup_entry(hass, entry, async_add_entities):
         DiagnosticTemperatureSensor(coord, device_key, device_info, key="delta", name="Delta Supervision"),
         DiagnosticPressureSensor(coord, device_key, device_info, key="pressure_1", name="Pression 1"),
         DiagnosticPressureSensor(coord, device_key, device_info, key="pressure_2", name="Pression 2"),
+        UnchangedPollsSensor(coord, device_key, device_info),
+        PollLagSensor(coord, device_key, device_info),
+        PollIntervalSensor(coord, device_key, device_info),
+        MergedWritesSensor(coord, device_key, device_info),
+        CircuitBreakerSensor(coord, device_key, device_info),
+        PollDurationSensor(coord, device_key, device_info, statistic="last"),
+        PollDurationSensor(coord, device_key, device_info, statistic="p95"),
+        *(
+            EndpointLatencySensor(coord, device_key, device_info, endpoint=key, page=page)
+            for key, page, _ in POLL_ENDPOINTS
+        ),
+        StaleRatioSensor(coord, device_key, device_info),
+        ConsecutiveFailuresSensor(coord, device_key, device_info),
+        BytesReceivedSensor(coord, device_key, device_info),
     ]
 
     if entry.options.get(CONF_ENABLE_RAW_SENSORS, False):
@@ -107,22 +149,13 @@ class TempSensor(OFoehnEntity, SensorEntity):
     ):
         super().__init__(coordinator, device_key, device_info)
         self._key = key
+        self._view_attribute = VIEW_ATTRIBUTES[key]
         self._attr_name = f"O'Foehn {name}"
         self._attr_unique_id = f"ofoehn_{key}_{device_key}"
 
     @property
     def native_value(self):
-        fallback_map = {
-            "water_in_idx": "water_in",
-            "water_out_idx": "water_out",
-            "air_idx": "air_temp",
-            "internal_idx": "internal_temp",
-        }
-        return get_donnee_float(
-            self.coordinator.data,
-            self._key,
-            fallback_key=fallback_map.get(self._key),
-        )
+        return getattr(self.coordinator.view, self._view_attribute)
 
 
 class VoltageSensor(OFoehnEntity, SensorEntity):
@@ -143,11 +176,7 @@ class VoltageSensor(OFoehnEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return get_donnee_float(
-            self.coordinator.data,
-            self._key,
-            fallback_key="voltage",
-        )
+        return self.coordinator.view.voltage
 
 
 class DiagnosticTemperatureSensor(OFoehnEntity, SensorEntity):
@@ -238,15 +267,7 @@ class SetpointDiffSensor(OFoehnEntity, SensorEntity):
 
     @property
     def native_value(self):
-        data = self.coordinator.data
-        delta = data.get("delta")
-        if delta is not None:
-            return delta
-        water_in = data.get("water_in")
-        setpoint = data.get("setpoint")
-        if water_in is None or setpoint is None:
-            return None
-        return round(setpoint - water_in, 2)
+        return self.coordinator.view.setpoint_diff
 
 
 class RegTextSensor(OFoehnEntity, SensorEntity):
@@ -262,40 +283,13 @@ class RegTextSensor(OFoehnEntity, SensorEntity):
     ):
         super().__init__(coordinator, device_key, device_info)
         self._key = key
+        self._view_attribute = VIEW_ATTRIBUTES[key]
         self._attr_name = f"O'Foehn {name}"
         self._attr_unique_id = f"ofoehn_{key}_{device_key}"
 
     @property
     def native_value(self):
-        reg_data = self.coordinator.data.get("reg", {})
-        value = reg_data.get(self._key)
-        if self._key == "mode":
-            fallback_mode = self.coordinator.data.get("mode")
-            reg_raw = clean_html_text(self.coordinator.data.get("reg_raw"))
-            if fallback_mode and (value is None or (value == "AUTO" and "AUTO" not in reg_raw.upper())):
-                return fallback_mode
-            return value or fallback_mode
-
-        if self._key == "status":
-            stopped_state = self.coordinator.data.get("stopped_state")
-            if stopped_state not in (None, "", "Inconnu"):
-                normalized = clean_html_text(stopped_state).lower()
-                if normalized not in {"normal", "marche", "en marche", "running"}:
-                    return stopped_state
-
-        if value not in (None, "", "Inconnu"):
-            return value
-
-        fallback_keys = {
-            "regulation": ("reg_mode",),
-            "next_action": ("next_action",),
-            "status": ("stopped_state", "general_state"),
-        }
-        for fallback_key in fallback_keys.get(self._key, ()):
-            fallback_value = self.coordinator.data.get(fallback_key)
-            if fallback_value not in (None, "", "Inconnu"):
-                return fallback_value
-        return value
+        return getattr(self.coordinator.view, self._view_attribute)
 
 
 class DiagnosticTextSensor(OFoehnEntity, SensorEntity):
@@ -319,8 +313,361 @@ class DiagnosticTextSensor(OFoehnEntity, SensorEntity):
         return self.coordinator.data.get(self._key)
 
 
+class PollStatsSensor(OFoehnEntity, SensorEntity):
+    """Diagnostic sensor refreshed after every poll cycle, even a failed one.
+
+    Unchanged polls do not notify coordinator listeners, so these follow the
+    per-poll stats callback instead. The ones that change at every poll are
+    disabled by default, so a steady pump writes no state unless asked to.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_stats_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        return True
+
+
+def _rounded(value: float | None, digits: int = 3) -> float | None:
+    return round(value, digits) if value is not None else None
+
+
+class UnchangedPollsSensor(PollStatsSensor):
+    """Count polls whose payloads were identical to the previous poll.
+
+    Disabled by default: it would write a state for the very polls that
+    should write none. The skip rate is also in the diagnostics download.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Interrogations inchangées"
+        self._attr_unique_id = f"ofoehn_diag_unchanged_polls_{device_key}"
+
+    @property
+    def native_value(self):
+        return self.coordinator.poll_stats["unchanged_polls"]
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.coordinator.poll_stats
+        polls = stats["polls"]
+        return {
+            "polls": polls,
+            "skip_rate": round(stats["unchanged_polls"] / polls, 3) if polls else None,
+        }
+
+
+class PollLagSensor(PollStatsSensor):
+    """Delay between a scheduled poll and the moment it actually started."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Retard d'interrogation"
+        self._attr_unique_id = f"ofoehn_diag_poll_lag_{device_key}"
+
+    @property
+    def native_value(self):
+        lag = self.coordinator.poll_lag
+        return round(lag, 3) if lag is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "max_lag": round(self.coordinator.max_poll_lag, 3),
+            "phase_offset": self.coordinator.phase_offset,
+            "interval": self.coordinator.poll_interval.total_seconds(),
+        }
+
+
+class PollIntervalSensor(PollStatsSensor):
+    """Current poll period and why it was chosen (adaptive mode)."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Intervalle d'interrogation"
+        self._attr_unique_id = f"ofoehn_diag_poll_interval_{device_key}"
+
+    @property
+    def native_value(self):
+        return self.coordinator.poll_interval.total_seconds()
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "reason": self.coordinator.interval_reason,
+            "base_interval": self.coordinator.base_interval.total_seconds(),
+        }
+
+
+class MergedWritesSensor(PollStatsSensor):
+    """Count setReg.cgi writes merged into another call's POST."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Commandes fusionnées"
+        self._attr_unique_id = f"ofoehn_diag_merged_writes_{device_key}"
+
+    @property
+    def native_value(self):
+        return self.coordinator.api.write_stats["merged"]
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.coordinator.api.write_stats
+        return {
+            "queued": self.coordinator.api.queued_writes,
+            "posts": stats["posts"],
+            "failed_posts": stats["failed_posts"],
+            "last_latency": stats["last_latency"],
+            "max_latency": stats["max_latency"],
+        }
+
+
+class CircuitBreakerSensor(PollStatsSensor):
+    """State of the per-device circuit breaker (closed, open, half_open)."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN]
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Disjoncteur"
+        self._attr_unique_id = f"ofoehn_diag_circuit_breaker_{device_key}"
+
+    @property
+    def native_value(self):
+        return self.coordinator.api.breaker.state
+
+    @property
+    def extra_state_attributes(self):
+        attributes = self.coordinator.api.breaker.as_dict()
+        attributes.pop("state")
+        return attributes
+
+
+class PollDurationSensor(PollStatsSensor):
+    """Duration of the last poll cycle, or its 95th percentile over the recent polls."""
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"mean", "samples"})
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+        statistic: str,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._statistic = statistic
+        suffix = "" if statistic == "last" else f" ({statistic})"
+        self._attr_name = f"O'Foehn Durée d'interrogation{suffix}"
+        self._attr_unique_id = f"ofoehn_diag_poll_duration_{statistic}_{device_key}"
+
+    @property
+    def native_value(self):
+        telemetry = self.coordinator.telemetry
+        if self._statistic == "last":
+            return _rounded(telemetry.last_poll_duration)
+        return _rounded(telemetry.recent_poll_duration.percentile(95))
+
+    @property
+    def extra_state_attributes(self):
+        window = self.coordinator.telemetry.recent_poll_duration
+        return {
+            "mean": _rounded(window.mean()),
+            "samples": len(window.values),
+        }
+
+
+class EndpointLatencySensor(PollStatsSensor):
+    """Latency of the last read of one endpoint; p95 over the recent reads in attributes."""
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"p95", "mean", "samples", "consecutive_failures"})
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+        endpoint: str,
+        page: str,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._endpoint = endpoint
+        self._attr_name = f"O'Foehn Latence {page}"
+        self._attr_unique_id = f"ofoehn_diag_latency_{endpoint}_{device_key}"
+
+    @property
+    def native_value(self):
+        return _rounded(self.coordinator.telemetry.endpoints[self._endpoint].recent_latency.last)
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.coordinator.telemetry.endpoints[self._endpoint]
+        window = stats.recent_latency
+        return {
+            "p95": _rounded(window.percentile(95)),
+            "mean": _rounded(window.mean()),
+            "samples": len(window.values),
+            "consecutive_failures": stats.consecutive_failures,
+        }
+
+
+class StaleRatioSensor(PollStatsSensor):
+    """Share of the recent polls that served cached data (super, accueil and reg stale flags)."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_suggested_display_precision = 1
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Lectures périmées"
+        self._attr_unique_id = f"ofoehn_diag_stale_ratio_{device_key}"
+
+    @property
+    def native_value(self):
+        ratio = self.coordinator.telemetry.stale_ratio()
+        return round(ratio * 100, 1) if ratio is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        telemetry = self.coordinator.telemetry
+        attributes = {}
+        for endpoint in telemetry.endpoints:
+            ratio = telemetry.stale_ratio(endpoint)
+            attributes[f"{endpoint}_stale"] = round(ratio * 100, 1) if ratio is not None else None
+        return attributes
+
+
+class ConsecutiveFailuresSensor(PollStatsSensor):
+    """Poll cycles in a row that raised or left an endpoint in error."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Échecs consécutifs"
+        self._attr_unique_id = f"ofoehn_diag_consecutive_failures_{device_key}"
+
+    @property
+    def native_value(self):
+        return self.coordinator.telemetry.consecutive_failed_polls
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            name: stats.consecutive_failures
+            for name, stats in self.coordinator.telemetry.endpoints.items()
+        }
+
+
+class BytesReceivedSensor(PollStatsSensor):
+    """Response bytes read from the pump since startup."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    def __init__(
+        self,
+        coordinator: OFoehnCoordinator,
+        device_key: str,
+        device_info: dict,
+    ):
+        super().__init__(coordinator, device_key, device_info)
+        self._attr_name = "O'Foehn Données reçues"
+        self._attr_unique_id = f"ofoehn_diag_bytes_received_{device_key}"
+
+    @property
+    def native_value(self):
+        return sum(stats["total_bytes"] for stats in self.coordinator.api.body_stats.values())
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            page: {"last": stats["bytes"], "total": stats["total_bytes"]}
+            for page, stats in self.coordinator.api.body_stats.items()
+        }
+
+
 class RawSensor(OFoehnEntity, SensorEntity):
+    """Raw payload of one endpoint, for debugging.
+
+    The text views are computed once per payload digest and capped; the full
+    payload is in the config entry diagnostics.
+    """
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"raw", "plain_text", "lines"})
 
     def __init__(
         self,
@@ -332,25 +679,42 @@ class RawSensor(OFoehnEntity, SensorEntity):
     ):
         super().__init__(coordinator, device_key, device_info)
         self._key = key
+        self._endpoint = key.removesuffix("_raw")
         self._attr_name = f"O'Foehn {name}"
         self._attr_unique_id = f"ofoehn_{key}_{device_key}"
+        self._digest: bytes | None = None
+        self._value: str | None = None
+        self._attributes: dict = {}
 
-    @property
-    def native_value(self):
-        value = self.coordinator.data.get(self._key)
+    def _refresh(self) -> None:
+        data = self.coordinator.data
+        section = data.section(self._endpoint) if data is not None else None
+        digest = section.digest if section is not None else None
+        if digest == self._digest:
+            return
+        self._digest = digest
+        value = section.raw if section is not None else None
         if value is None:
-            return None
+            self._value, self._attributes = None, {}
+            return
         preview = clean_html_text(value)
-        return (preview or value)[:255]
+        lines = clean_html_lines(value)
+        self._value = (preview or value)[:255]
+        self._attributes = {
+            "raw": value[:RAW_ATTRIBUTE_MAX_CHARS],
+            "plain_text": preview[:RAW_ATTRIBUTE_MAX_CHARS],
+            "lines": lines[:RAW_ATTRIBUTE_MAX_LINES],
+            "size": len(value),
+            "truncated": len(value) > RAW_ATTRIBUTE_MAX_CHARS
+            or len(lines) > RAW_ATTRIBUTE_MAX_LINES,
+        }
+
+    @property
+    def native_value(self):
+        self._refresh()
+        return self._value
 
     @property
     def extra_state_attributes(self):
-        value = self.coordinator.data.get(self._key)
-        if value is None:
-            return {}
-        preview = clean_html_text(value)
-        return {
-            "raw": value,
-            "plain_text": preview,
-            "lines": clean_html_lines(value),
-        }
+        self._refresh()
+        return self._attributes
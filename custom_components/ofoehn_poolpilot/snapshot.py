@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class EndpointSection:
+    """Parsed state of one poll endpoint.
+
+    ``fields`` holds the flat values of the endpoint parser. Sections are
+    never mutated: a poll that did not re-read an endpoint reuses the previous
+    section object, and staleness or optimistic values produce a copy.
+    """
+
+    digest: bytes
+    size: int  # payload length; 0 when the endpoint never answered
+    fields: dict[str, Any]
+    metadata: dict[str, Any]
+    stale: bool = False
+    error: str | None = None
+    raw: str | None = None  # only kept while the raw sensors are enabled
+
+
+@dataclass(slots=True)
+class SuperSection(EndpointSection):
+    """super.cgi: line values and DONNEE map."""
+
+    donnees: dict[int, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class AccueilSection(EndpointSection):
+    """accueil.cgi: labelled or compact page values and DONNEE map."""
+
+    donnees: dict[int, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RegSection(EndpointSection):
+    """getReg.cgi: setpoint, mode, regulation and flags."""
+
+    mentions_auto: bool = False  # the page text contains AUTO
+
+
+# Keys of the legacy flat snapshot served from a section attribute.
+_SECTION_KEYS: dict[str, tuple[str, str]] = {
+    "super": ("super", "donnees"),
+    "accueil": ("accueil", "donnees"),
+    "reg": ("reg", "fields"),
+    **{
+        f"{endpoint}_{suffix}": (endpoint, suffix)
+        for endpoint in ("super", "accueil", "reg")
+        for suffix in ("raw", "stale", "error")
+    },
+}
+
+
+@dataclass(slots=True)
+class PollSnapshot(Mapping[str, Any]):
+    """Coordinator data: one section per poll endpoint.
+
+    The snapshot also reads as the flat dict the entities were written
+    against: ``super``/``accueil`` are the DONNEE maps, ``reg`` the getReg
+    fields, ``<endpoint>_raw|_stale|_error`` the section state, and any other
+    key is looked up in the optimistic overrides, then the accueil, super and
+    page metadata fields, in that order of precedence.
+    """
+
+    super: SuperSection
+    accueil: AccueilSection
+    reg: RegSection
+    indices: dict[str, int]
+    overrides: dict[str, Any] = field(default_factory=dict)
+    restored: bool = False  # loaded from storage, no poll answered yet
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Page metadata of the first endpoint that served an HTML page."""
+        return self.super.metadata or self.accueil.metadata or self.reg.metadata
+
+    def section(self, endpoint: str) -> EndpointSection:
+        return getattr(self, endpoint)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.overrides.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        location = _SECTION_KEYS.get(key)
+        if location is not None:
+            return getattr(getattr(self, location[0]), location[1])
+        if key == "indices":
+            return self.indices
+        for source in (self.accueil.fields, self.super.fields, self.metadata):
+            value = source.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(
+            dict.fromkeys(
+                [
+                    *_SECTION_KEYS,
+                    *self.metadata,
+                    *self.super.fields,
+                    *self.accueil.fields,
+                    *self.overrides,
+                    "indices",
+                ]
+            )
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Flatten into the legacy snapshot dict."""
+        return {key: self[key] for key in self}
+
+    def mark_stale(self, error: str) -> PollSnapshot:
+        """Copy with every endpoint flagged stale, e.g. while the device is offline."""
+        return replace(
+            self,
+            super=replace(self.super, stale=True, error=error),
+            accueil=replace(self.accueil, stale=True, error=error),
+            reg=replace(self.reg, stale=True, error=error),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EntityView:
+    """Entity values resolved from one snapshot, DONNEE and fallback chains included.
+
+    The coordinator builds it once per published snapshot; entity properties
+    only read its attributes.
+    """
+
+    super_stale: bool = False
+    restored: bool = False
+    power_on: bool = True
+    climate_mode: str = "AUTO"  # OFF, CHAUD, FROID or AUTO, OFF while powered down
+    target_temperature: float | None = None
+    water_in: float | None = None
+    water_out: float | None = None
+    air: float | None = None
+    internal_temp: float | None = None
+    voltage: float | None = None
+    setpoint_diff: float | None = None
+    reg_mode: Any = None
+    regulation: Any = None
+    next_action: Any = None
+    status: Any = None
+    pump_on: bool = False
+    heating_on: bool = False
+    light_on: bool = False
@@ -4,7 +4,7 @@ from homeassistant.components.switch import SwitchEntity
 
 from .const import DOMAIN
 from .coordinator import OFoehnCoordinator
-from .helpers import OFoehnEntity, get_donnee_bool
+from .helpers import OFoehnEntity
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -28,23 +28,15 @@ class PowerSwitch(OFoehnEntity, SwitchEntity):
 
     @property
     def is_on(self):
-        result = get_donnee_bool(
-            self.coordinator.data,
-            "power_idx",
-            fallback_key="power_on",
-            default=True,
-        )
-        return bool(result)
+        return self.coordinator.view.power_on
 
     async def async_turn_on(self, **kwargs):
         if not self.is_on:
-            await self.coordinator.api.toggle_power()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.toggle_power(), ("super",), power=True)
 
     async def async_turn_off(self, **kwargs):
         if self.is_on:
-            await self.coordinator.api.toggle_power()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.toggle_power(), ("super",), power=False)
 
 
 class PoolLightSwitch(OFoehnEntity, SwitchEntity):
@@ -56,15 +48,12 @@ class PoolLightSwitch(OFoehnEntity, SwitchEntity):
 
     @property
     def is_on(self):
-        idx = self.coordinator.data["indices"]["light_idx"]
-        return self.coordinator.data["accueil"].get(idx, 0) == 1
+        return self.coordinator.view.light_on
 
     async def async_turn_on(self, **kwargs):
         if not self.is_on:
-            await self.coordinator.api.set_light(True)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.set_light(True), ("accueil",), light=True)
 
     async def async_turn_off(self, **kwargs):
         if self.is_on:
-            await self.coordinator.api.set_light(False)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(self.coordinator.api.set_light(False), ("accueil",), light=False)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import Any
+
+from .const import LATENCY_BUCKETS, PAYLOAD_HISTORY, PERF_WINDOW
+from .snapshot import PollSnapshot
+
+
+def _rounded(value: float | None, digits: int = 4) -> float | None:
+    return round(value, digits) if value is not None else None
+
+
+class Histogram:
+    """Counts per upper bound, in seconds; the last bucket catches the rest."""
+
+    __slots__ = ("bounds", "counts", "total", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def add(self, value: float) -> None:
+        for position, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            position = len(self.bounds)
+        self.counts[position] += 1
+        self.total += 1
+        self.sum += value
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}s" for bound in self.bounds] + [f">{self.bounds[-1]}s"]
+        return {
+            "count": self.total,
+            "mean": round(self.sum / self.total, 4) if self.total else None,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RollingWindow:
+    """The last ``size`` samples, oldest dropped first."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, size: int = PERF_WINDOW) -> None:
+        self.values: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        self.values.append(value)
+
+    @property
+    def last(self) -> float | None:
+        return self.values[-1] if self.values else None
+
+    def mean(self) -> float | None:
+        return sum(self.values) / len(self.values) if self.values else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank percentile of the window."""
+        if not self.values:
+            return None
+        ordered = sorted(self.values)
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class EndpointTelemetry:
+    """Reads, payloads and parse times of one poll endpoint."""
+
+    __slots__ = (
+        "reads",
+        "skipped",
+        "successes",
+        "stale",
+        "failures",
+        "last_error",
+        "latency",
+        "recent_latency",
+        "recent_stale",
+        "consecutive_failures",
+        "last_size",
+        "max_size",
+        "parses",
+        "parse_ms",
+        "max_parse_ms",
+        "payloads",
+    )
+
+    def __init__(self, history: int = PAYLOAD_HISTORY) -> None:
+        self.reads = 0
+        self.skipped = 0
+        self.successes = 0
+        self.stale = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self.latency = Histogram()
+        self.recent_latency = RollingWindow()
+        self.recent_stale = RollingWindow()  # 1.0 per poll that served it stale
+        self.consecutive_failures = 0
+        self.last_size: int | None = None
+        self.max_size = 0
+        self.parses = 0
+        self.parse_ms = 0.0
+        self.max_parse_ms = 0.0
+        # (wall clock, payload) of the last distinct payloads, newest last.
+        self.payloads: deque[tuple[float, str]] = deque(maxlen=history)
+
+    def record_read(self, latency: float, raw: str | None, stale: bool, error: str | None) -> None:
+        self.reads += 1
+        self.latency.add(latency)
+        self.recent_latency.add(latency)
+        if stale:
+            self.stale += 1
+        if error is not None:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = error
+            return
+        self.successes += 1
+        self.consecutive_failures = 0
+        if raw is None:
+            return
+        self.last_size = len(raw)
+        self.max_size = max(self.max_size, len(raw))
+        if not self.payloads or self.payloads[-1][1] != raw:
+            self.payloads.append((time.time(), raw))
+
+    def record_skipped(self, error: str) -> None:
+        """An endpoint not read this cycle, served stale from the last payload."""
+        self.skipped += 1
+        self.stale += 1
+        self.last_error = error
+
+    def record_parse(self, elapsed: float) -> None:
+        elapsed_ms = elapsed * 1000
+        self.parses += 1
+        self.parse_ms += elapsed_ms
+        self.max_parse_ms = max(self.max_parse_ms, elapsed_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "reads": self.reads,
+            "skipped": self.skipped,
+            "successes": self.successes,
+            "stale": self.stale,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "latency": {
+                "p95": _rounded(self.recent_latency.percentile(95)),
+                **self.latency.as_dict(),
+            },
+            "last_size": self.last_size,
+            "max_size": self.max_size,
+            "parses": self.parses,
+            "mean_parse_ms": round(self.parse_ms / self.parses, 3) if self.parses else None,
+            "max_parse_ms": round(self.max_parse_ms, 3),
+        }
+
+
+class PollTelemetry:
+    """In-memory poll statistics of one device, for the diagnostics download."""
+
+    def __init__(self, endpoints: tuple[str, ...] = ("super", "accueil", "reg")) -> None:
+        self.endpoints = {endpoint: EndpointTelemetry() for endpoint in endpoints}
+        self.poll_duration = Histogram()
+        self.recent_poll_duration = RollingWindow()
+        self.last_poll_duration: float | None = None
+        self.consecutive_failed_polls = 0
+
+    def record_poll(self, duration: float, snapshot: PollSnapshot | None) -> None:
+        """Close a poll cycle; ``snapshot`` is None when the poll raised.
+
+        A poll failed when it raised or any endpoint ended with an error.
+        """
+        self.last_poll_duration = duration
+        self.poll_duration.add(duration)
+        self.recent_poll_duration.add(duration)
+        failed = snapshot is None
+        for name, stats in self.endpoints.items():
+            section = snapshot.section(name) if snapshot is not None else None
+            stats.recent_stale.add(1.0 if section is None or section.stale else 0.0)
+            if section is not None and section.error is not None:
+                failed = True
+        self.consecutive_failed_polls = self.consecutive_failed_polls + 1 if failed else 0
+
+    def stale_ratio(self, endpoint: str | None = None) -> float | None:
+        """Share of the recent polls that served stale data, over all endpoints by default."""
+        windows = [
+            stats.recent_stale.values
+            for name, stats in self.endpoints.items()
+            if endpoint is None or name == endpoint
+        ]
+        samples = sum(len(values) for values in windows)
+        return sum(sum(values) for values in windows) / samples if samples else None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "poll_duration": {
+                "last": _rounded(self.last_poll_duration),
+                "p95": _rounded(self.recent_poll_duration.percentile(95)),
+                **self.poll_duration.as_dict(),
+            },
+            "consecutive_failed_polls": self.consecutive_failed_polls,
+            "stale_ratio": _rounded(self.stale_ratio()),
+            "endpoints": {name: stats.as_dict() for name, stats in self.endpoints.items()},
+        }